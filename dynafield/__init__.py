@@ -1,22 +1,41 @@
-from dynafield.fields.base_field import DataTypeFieldBase, FieldTypeEnum, build_dynamic_model
-from dynafield.fields.bool_field import BoolField
-from dynafield.fields.date_field import DateField, DateTimeField
-from dynafield.fields.email_field import EmailField
-from dynafield.fields.enum_field import EnumField
-from dynafield.fields.float_field import FloatField
-from dynafield.fields.int_field import IntField
-from dynafield.fields.json_field import JsonField
-from dynafield.fields.list_field import ListField
-from dynafield.fields.object_field import ObjectField
-from dynafield.fields.str_field import StrField
-from dynafield.fields.uuid_field import UuidField
-from dynafield.from_func import build_model_from_function, fields_from_function
-from dynafield.record_schema import (
-    RecordSchemaDefinition,
-    RecordSchemaRegistry,
-    TypeFieldsUnion,
-    TypeFieldsUnionGql,
-)
+import importlib
+from typing import Any
+
+# name -> (module path, attribute or None for the module itself). Resolved on first access (PEP 562).
+_LAZY_ATTRS: dict[str, tuple[str, str | None]] = {
+    "build_model_from_function": ("dynafield.from_func", "build_model_from_function"),
+    "fields_from_function": ("dynafield.from_func", "fields_from_function"),
+    "build_dynamic_model": ("dynafield.fields.base_field", "build_dynamic_model"),
+    "FieldTypeEnum": ("dynafield.fields.base_field", "FieldTypeEnum"),
+    "DataTypeFieldBase": ("dynafield.fields.base_field", "DataTypeFieldBase"),
+    "BoolField": ("dynafield.fields.bool_field", "BoolField"),
+    "DateField": ("dynafield.fields.date_field", "DateField"),
+    "DateTimeField": ("dynafield.fields.date_field", "DateTimeField"),
+    "EmailField": ("dynafield.fields.email_field", "EmailField"),
+    "EnumField": ("dynafield.fields.enum_field", "EnumField"),
+    "FloatField": ("dynafield.fields.float_field", "FloatField"),
+    "IntField": ("dynafield.fields.int_field", "IntField"),
+    "JsonField": ("dynafield.fields.json_field", "JsonField"),
+    "ListField": ("dynafield.fields.list_field", "ListField"),
+    "StrField": ("dynafield.fields.str_field", "StrField"),
+    "UuidField": ("dynafield.fields.uuid_field", "UuidField"),
+    "ObjectField": ("dynafield.fields.object_field", "ObjectField"),
+    "RecordSchemaDefinition": ("dynafield.record_schema", "RecordSchemaDefinition"),
+    "RecordSchemaRegistry": ("dynafield.record_schema", "RecordSchemaRegistry"),
+    "TypeFieldsUnion": ("dynafield.record_schema", "TypeFieldsUnion"),
+    "TypeFieldsUnionGql": ("dynafield.record_schema", "TypeFieldsUnionGql"),
+    "TYPE_FIELDS_BY_TYPENAME": ("dynafield.record_schema", "TYPE_FIELDS_BY_TYPENAME"),
+    # Subpackages, so ``dynafield.amqp`` etc. work without an explicit import
+    "amqp": ("dynafield.amqp", None),
+    "clerk": ("dynafield.clerk", None),
+    "database": ("dynafield.database", None),
+    "expressions": ("dynafield.expressions", None),
+    "gql": ("dynafield.gql", None),
+    "logger": ("dynafield.logger", None),
+    "models": ("dynafield.models", None),
+    "tracing": ("dynafield.tracing", None),
+    "utils": ("dynafield.utils", None),
+}
 
 __all__ = [
     "build_model_from_function",
@@ -40,4 +59,21 @@ __all__ = [
     "RecordSchemaRegistry",
     "TypeFieldsUnion",
     "TypeFieldsUnionGql",
+    "TYPE_FIELDS_BY_TYPENAME",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_path, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_path)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,56 @@
+from dynafield import amqp as amqp
+from dynafield import clerk as clerk
+from dynafield import database as database
+from dynafield import expressions as expressions
+from dynafield import gql as gql
+from dynafield import logger as logger
+from dynafield import models as models
+from dynafield import tracing as tracing
+from dynafield import utils as utils
+from dynafield.fields.base_field import DataTypeFieldBase as DataTypeFieldBase
+from dynafield.fields.base_field import FieldTypeEnum as FieldTypeEnum
+from dynafield.fields.base_field import build_dynamic_model as build_dynamic_model
+from dynafield.fields.bool_field import BoolField as BoolField
+from dynafield.fields.date_field import DateField as DateField
+from dynafield.fields.date_field import DateTimeField as DateTimeField
+from dynafield.fields.email_field import EmailField as EmailField
+from dynafield.fields.enum_field import EnumField as EnumField
+from dynafield.fields.float_field import FloatField as FloatField
+from dynafield.fields.int_field import IntField as IntField
+from dynafield.fields.json_field import JsonField as JsonField
+from dynafield.fields.list_field import ListField as ListField
+from dynafield.fields.object_field import ObjectField as ObjectField
+from dynafield.fields.str_field import StrField as StrField
+from dynafield.fields.uuid_field import UuidField as UuidField
+from dynafield.from_func import build_model_from_function as build_model_from_function
+from dynafield.from_func import fields_from_function as fields_from_function
+from dynafield.record_schema import TYPE_FIELDS_BY_TYPENAME as TYPE_FIELDS_BY_TYPENAME
+from dynafield.record_schema import RecordSchemaDefinition as RecordSchemaDefinition
+from dynafield.record_schema import RecordSchemaRegistry as RecordSchemaRegistry
+from dynafield.record_schema import TypeFieldsUnion as TypeFieldsUnion
+from dynafield.record_schema import TypeFieldsUnionGql as TypeFieldsUnionGql
+
+__all__ = [
+    "build_model_from_function",
+    "fields_from_function",
+    "build_dynamic_model",
+    "FieldTypeEnum",
+    "DataTypeFieldBase",
+    "BoolField",
+    "DateField",
+    "DateTimeField",
+    "EmailField",
+    "EnumField",
+    "FloatField",
+    "IntField",
+    "JsonField",
+    "ListField",
+    "StrField",
+    "UuidField",
+    "ObjectField",
+    "RecordSchemaDefinition",
+    "RecordSchemaRegistry",
+    "TypeFieldsUnion",
+    "TypeFieldsUnionGql",
+    "TYPE_FIELDS_BY_TYPENAME",
+]
@@ -0,0 +1,214 @@
+import asyncio
+import time
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
+
+from aio_pika import DeliveryMode, Message, connect_robust
+from aio_pika.abc import AbstractExchange, AbstractIncomingMessage, AbstractRobustConnection, FieldValue
+from faststream.rabbit import RabbitQueue
+
+from dynafield.amqp.pika import RabbitMQPeeker
+from dynafield.logger.logger_config import get_logger
+from dynafield.models.error_msg import ErrorMessage
+from dynafield.utils import json_tools
+
+log = get_logger(__name__)
+
+
+def _parse(message: AbstractIncomingMessage, total_message_count: int = 0, current_index: int = 0) -> ErrorMessage:
+    # aio-pika messages expose the same redelivered/headers/message_id attributes the pika frames do
+    return RabbitMQPeeker.parse_error_message(
+        body=message.body,
+        method_frame=message,
+        header_frame=message,
+        total_message_count=total_message_count,
+        current_index=current_index,
+    )
+
+
+class AsyncRabbitMQPeeker:
+    """
+    Async counterpart of RabbitMQPeeker.
+    Deliveries are streamed with a consumer and prefetch instead of one basic_get round-trip per message.
+    """
+
+    def __init__(
+        self,
+        error_queue: RabbitQueue,
+        host: str,
+        port: int = 5672,
+        virtual_host: str = "/",
+        username: str = "guest",
+        password: str = "guest",
+        prefetch_count: int = 100,
+    ) -> None:
+        self.error_queue = error_queue
+        self.prefetch_count = prefetch_count
+        self._connection_kwargs: Dict[str, Any] = {
+            "host": host,
+            "port": port,
+            "virtualhost": virtual_host,
+            "login": username,
+            "password": password,
+        }
+        self._connection: Optional[AbstractRobustConnection] = None
+
+    async def __aenter__(self) -> "AsyncRabbitMQPeeker":
+        return self
+
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Optional[TracebackType]) -> None:
+        await self.close()
+
+    async def _get_connection(self) -> AbstractRobustConnection:
+        if self._connection is None or self._connection.is_closed:
+            self._connection = await connect_robust(**self._connection_kwargs)
+        return self._connection
+
+    async def close(self) -> None:
+        """Close the shared connection"""
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+        self._connection = None
+
+    async def peek_messages(self, service_filter: Optional[List[str]] = None, max_messages: int = 50, timeout: float = 5.0) -> List[ErrorMessage]:
+        """
+        Peek at messages in error queue without consuming them.
+        All deliveries are held unacked while peeking and requeued together at the end.
+        """
+        connection = await self._get_connection()
+        messages: List[ErrorMessage] = []
+
+        async with connection.channel() as channel:
+            queue = await channel.declare_queue(self.error_queue.name, passive=True)
+            message_count = queue.declaration_result.message_count or 0
+            to_read = min(max_messages, message_count)
+
+            if to_read == 0:
+                log.info("No messages in error queue '%s'", self.error_queue.name)
+                return []
+
+            # Every peeked delivery stays unacked, so the broker must be allowed to push all of them
+            await channel.set_qos(prefetch_count=max(self.prefetch_count, to_read))
+            last_message: Optional[AbstractIncomingMessage] = None
+
+            async def _collect() -> None:
+                nonlocal last_message
+                async with queue.iterator() as queue_iter:
+                    seen = 0
+                    async for message in queue_iter:
+                        last_message = message
+                        error_message = _parse(message, total_message_count=message_count, current_index=seen)
+                        if service_filter is None or error_message.service_name in service_filter:
+                            messages.append(error_message)
+                        seen += 1
+                        if seen >= to_read:
+                            break
+
+            try:
+                await asyncio.wait_for(_collect(), timeout=timeout)
+            except asyncio.TimeoutError:
+                log.warning("Peek timed out after %ss with %s messages", timeout, len(messages))
+            finally:
+                if last_message is not None:
+                    await last_message.nack(multiple=True, requeue=True)
+
+        log.info("Peeked %s messages from error queue", len(messages))
+        return messages
+
+    async def resend_messages(
+        self, service_filter: Optional[List[str]] = None, limit: Optional[int] = None, remove_from_queue: bool = True, timeout: float = 30.0
+    ) -> Dict[str, Any]:
+        """
+        Resend messages from error queue to their original destinations.
+        Skipped and failed deliveries are requeued in one nack once the batch is done.
+        """
+        connection = await self._get_connection()
+        results = {
+            "total_processed": 0,
+            "successfully_resent": 0,
+            "failed": 0,
+            "skipped": 0,
+        }
+
+        async with connection.channel() as channel:
+            queue = await channel.declare_queue(self.error_queue.name, passive=True)
+            message_count = queue.declaration_result.message_count or 0
+            to_read = min(limit, message_count) if limit else message_count
+
+            if to_read == 0:
+                log.info("No messages in error queue '%s'", self.error_queue.name)
+                return results
+
+            # Skipped and failed deliveries stay unacked until the end, so the broker must be allowed to push all of them
+            await channel.set_qos(prefetch_count=max(self.prefetch_count, to_read))
+            exchanges: Dict[str, AbstractExchange] = {}
+            resent_at = time.time()
+            resent_headers: Dict[str, FieldValue] = {"x-resent": True, "x-resent-timestamp": str(resent_at)}
+            last_held: Optional[AbstractIncomingMessage] = None
+
+            async def _resend(message: AbstractIncomingMessage) -> bool:
+                error_message = _parse(message)
+                if not error_message.payload or not error_message.exchange or not error_message.routing_key:
+                    log.error("Missing required info in message %s", message.delivery_tag)
+                    results["failed"] += 1
+                    return False
+
+                if service_filter and error_message.service_name not in service_filter:
+                    results["skipped"] += 1
+                    return False
+
+                exchange = exchanges.get(error_message.exchange)
+                if exchange is None:
+                    exchange = exchanges[error_message.exchange] = await channel.get_exchange(error_message.exchange)
+
+                headers: Dict[str, FieldValue] = resent_headers
+                if error_message.tenant_id:
+                    headers = {**resent_headers, "x-tenant-id": error_message.tenant_id}
+
+                await exchange.publish(
+                    Message(
+                        body=json_tools.dumps(error_message.payload),
+                        content_type=message.content_type or "application/json",
+                        delivery_mode=DeliveryMode.PERSISTENT,
+                        headers=headers,
+                        message_id=error_message.message_id,
+                        timestamp=resent_at,
+                    ),
+                    routing_key=error_message.routing_key,
+                )
+                results["successfully_resent"] += 1
+                return True
+
+            async def _drain() -> None:
+                nonlocal last_held
+                async with queue.iterator() as queue_iter:
+                    async for message in queue_iter:
+                        results["total_processed"] += 1
+                        try:
+                            resent = await _resend(message)
+                        except Exception as e:
+                            log.error("Error processing message %s: %s", message.delivery_tag, e)
+                            results["failed"] += 1
+                            resent = False
+
+                        if resent and remove_from_queue:
+                            await message.ack()
+                        else:
+                            last_held = message
+
+                        if results["total_processed"] >= to_read:
+                            break
+
+            try:
+                await asyncio.wait_for(_drain(), timeout=timeout)
+            except asyncio.TimeoutError:
+                log.warning("Resend timed out after %ss", timeout)
+            except Exception as e:
+                log.error("Error in resend_messages: %s", e)
+            finally:
+                if last_held is not None:
+                    # Requeues every still-unacked delivery up to the last held one; acked deliveries are unaffected
+                    await last_held.nack(multiple=True, requeue=True)
+
+        log.info("Resend operation completed: %s", results)
+        return results
@@ -1,23 +1,30 @@
-import json
 import logging
 import time
+from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from types import TracebackType
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 import pika
 from faststream.rabbit import RabbitQueue
-from pika.adapters.blocking_connection import BlockingChannel
+from pika.adapters.blocking_connection import BlockingChannel, BlockingConnection
+from pika.exceptions import AMQPError
 
 from dynafield.models.error_msg import ErrorMessage
+from dynafield.utils import json_tools
 
 log = logging.getLogger(__name__)
 
+# How long a passive queue_declare message count is trusted before re-asking the broker
+QUEUE_INFO_TTL = 1.0
+
 
 class RabbitMQPeeker:
     def __init__(
         self, error_queue: RabbitQueue, host: str, port: int = 5672, virtual_host: str = "/", username: str = "guest", password: str = "guest"
     ) -> None:
         self.error_queue = error_queue
+        self._queue_name: str = error_queue.name
         self.connection_params = pika.ConnectionParameters(
             host=host,
             port=port,
@@ -26,11 +33,64 @@ class RabbitMQPeeker:
             heartbeat=600,
             blocked_connection_timeout=300,
         )
+        self._connection: Optional[BlockingConnection] = None
+        self._queue_info_cache: Dict[str, Tuple[float, int]] = {}
+
+    def __enter__(self) -> "RabbitMQPeeker":
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Optional[TracebackType]) -> None:
+        self.close()
+
+    def _get_connection(self) -> BlockingConnection:
+        """Lazily open one connection and reuse it across operations"""
+        if self._connection is not None and self._connection.is_open:
+            try:
+                # An idle BlockingConnection never services heartbeats on its own: pump pending I/O
+                # so a connection the broker dropped in the meantime is noticed before reuse
+                self._connection.process_data_events(time_limit=0)
+            except AMQPError:
+                log.warning("Shared RabbitMQ connection is dead, reconnecting")
+                self._connection = None
+        if self._connection is None or self._connection.is_closed:
+            self._connection = pika.BlockingConnection(self.connection_params)
+        return self._connection
 
     def get_channel(self) -> BlockingChannel:
-        """Get a fresh channel for each operation"""
-        connection = pika.BlockingConnection(self.connection_params)
-        return connection.channel()
+        """Get a fresh channel on the shared connection for each operation"""
+        return self._get_connection().channel()
+
+    @contextmanager
+    def _channel(self) -> Iterator[BlockingChannel]:
+        """Channel for one operation; closing it must never mask the operation's own error"""
+        channel = self.get_channel()
+        try:
+            yield channel
+        finally:
+            with suppress(AMQPError):
+                channel.close()
+
+    def close(self) -> None:
+        """Close the shared connection - call this when the peeker is no longer needed"""
+        if self._connection is not None and self._connection.is_open:
+            self._connection.close()
+        self._connection = None
+
+    def invalidate(self) -> None:
+        """Drop cached queue counts so the next operation asks the broker again"""
+        self._queue_info_cache.clear()
+
+    def _get_message_count(self, channel: BlockingChannel, queue_name: str) -> int:
+        """Message count from a passive declare, cached for QUEUE_INFO_TTL seconds"""
+        now = time.monotonic()
+        cached = self._queue_info_cache.get(queue_name)
+        if cached is not None and now - cached[0] < QUEUE_INFO_TTL:
+            return cached[1]
+
+        queue_declare = channel.queue_declare(queue=queue_name, passive=True)
+        message_count: int = queue_declare.method.message_count
+        self._queue_info_cache[queue_name] = (now, message_count)
+        return message_count
 
     @staticmethod
     def parse_error_message(
@@ -44,7 +104,7 @@ class RabbitMQPeeker:
         Parse a raw RabbitMQ message into ErrorMessage model and extract metadata.
         """
         try:
-            error_wrapper = json.loads(body.decode("utf-8"))
+            error_wrapper = json_tools.loads(body)
             # Extract original payload from wrapper
             original_payload = error_wrapper.pop("payload", {})
             error_info = error_wrapper.get("error_info", {})
@@ -58,29 +118,28 @@ class RabbitMQPeeker:
             timestamp = None
             if timestamp_str:
                 try:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                    # Python 3.11+ fromisoformat accepts a trailing "Z" natively
+                    timestamp = datetime.fromisoformat(timestamp_str)
                 except Exception as e:
-                    log.debug(f"Failed to parse timestamp {e}")
+                    log.debug("Failed to parse timestamp %s", e)
                     timestamp = datetime.now(timezone.utc)
 
             # Extract tenant ID from various sources
             tenant_id = None
             if original_payload and isinstance(original_payload, dict):
                 tenant_id = original_payload.get("tenant_id")
-            if header_frame and header_frame.headers is not None:
-                header_dict: Dict[str, Any] = dict(header_frame.headers)
-            else:
-                header_dict = {}
+            # ErrorMessage validation already builds its own dict, no need to copy here
+            header_dict: Dict[str, Any] = header_frame.headers if header_frame and header_frame.headers is not None else {}
             # Create ErrorMessage model
             error_message = ErrorMessage(
-                message_id=error_info.get("message_id") or getattr(header_frame, "message_id", None),
+                message_id=error_info.get("message_id") or (header_frame.message_id if header_frame else None),
                 body=error_wrapper,  # Store original payload, not wrapper
                 service_name=service_name,
                 routing_key=source_queue,
                 exchange=source_exchange,
                 headers=header_dict,
                 timestamp=timestamp,
-                redelivered=getattr(method_frame, "redelivered", False) if method_frame else False,
+                redelivered=method_frame.redelivered if method_frame else False,
                 message_index=total_message_count - current_index - 1,
                 tenant_id=tenant_id,
                 payload=original_payload,
@@ -103,49 +162,49 @@ class RabbitMQPeeker:
         """
         Peek at messages in error queue without consuming them.
         """
-        channel = self.get_channel()
         messages = []
+        last_delivery_tag: Optional[int] = None
+
+        with self._channel() as channel:
+            try:
+                # Get queue info
+                message_count = self._get_message_count(channel, self._queue_name)
+
+                if message_count == 0:
+                    log.info("No messages in error queue '%s'", self._queue_name)
+                    return []
+
+                # Peek at messages, holding them unacked so basic_get keeps advancing through the queue
+                for i in range(min(max_messages, message_count)):
+                    method_frame, header_frame, body = channel.basic_get(queue=self._queue_name, auto_ack=False)
+
+                    if not method_frame:
+                        break
+                    last_delivery_tag = method_frame.delivery_tag
+                    error_message = self.parse_error_message(
+                        body=body, method_frame=method_frame, header_frame=header_frame, total_message_count=message_count, current_index=i
+                    )
 
-        try:
-            # Get queue info
-            queue_declare = channel.queue_declare(queue=self.error_queue.name, passive=True)
-            message_count = queue_declare.method.message_count
-
-            if message_count == 0:
-                log.info(f"No messages in error queue '{self.error_queue.name}'")
-                return []
-
-            # Peek at messages
-            for i in range(min(max_messages, message_count)):
-                method_frame, header_frame, body = channel.basic_get(queue=self.error_queue.name, auto_ack=False)
-
-                if not method_frame:
-                    break
-                error_message = self.parse_error_message(
-                    body=body, method_frame=method_frame, header_frame=header_frame, total_message_count=message_count, current_index=i
-                )
-
-                if service_filter is not None and error_message.service_name not in service_filter:
-                    continue
+                    if service_filter is not None and error_message.service_name not in service_filter:
+                        continue
 
-                messages.append(error_message)
-                channel.basic_reject(method_frame.delivery_tag, requeue=True)
+                    messages.append(error_message)
 
-        except Exception as e:
-            log.error(f"Error peeking messages: {e}")
-            raise
-        finally:
-            if channel and channel.is_open:
-                channel.connection.close()
+            except Exception as e:
+                log.error("Error peeking messages: %s", e)
+                raise
+            finally:
+                # Requeue every peeked delivery in a single frame
+                if last_delivery_tag is not None and channel.is_open:
+                    channel.basic_nack(delivery_tag=last_delivery_tag, multiple=True, requeue=True)
 
-        log.info(f"Peeked {len(messages)} messages from error queue")
+        log.info("Peeked %s messages from error queue", len(messages))
         return messages
 
     def resend_messages(self, service_filter: Optional[List[str]] = None, limit: Optional[int] = None, remove_from_queue: bool = True) -> Dict[str, Any]:
         """
         Resend messages from error queue to their original destinations.
         """
-        channel = self.get_channel()
         results = {
             "total_processed": 0,
             "successfully_resent": 0,
@@ -153,130 +212,139 @@ class RabbitMQPeeker:
             "skipped": 0,
         }
 
-        try:
-            processed = 0
-
-            while True:
-                if limit and processed >= limit:
-                    break
-
-                method_frame, header_frame, body = channel.basic_get(queue=self.error_queue.name, auto_ack=False)
-
-                if not method_frame:
-                    break
-
-                results["total_processed"] += 1
-                processed += 1
-                delivery_tag = method_frame.delivery_tag
-
-                try:
-                    # Parse the message
-                    error_message = self.parse_error_message(body=body, method_frame=method_frame, header_frame=header_frame)
-
-                    original_payload = error_message.payload
-                    source_exchange = error_message.exchange
-                    source_queue = error_message.routing_key
-                    service_name = error_message.service_name
-
-                    # Validate
-                    if not original_payload or not source_exchange or not source_queue:
-                        log.error(f"Missing required info in message {delivery_tag}")
-                        channel.basic_reject(delivery_tag, requeue=True)
+        with self._channel() as channel:
+            try:
+                processed = 0
+                # Same resend markers for the whole batch
+                resent_headers, resent_timestamp = self._resend_markers()
+
+                while True:
+                    if limit and processed >= limit:
+                        break
+
+                    method_frame, header_frame, body = channel.basic_get(queue=self._queue_name, auto_ack=False)
+
+                    if not method_frame:
+                        break
+
+                    results["total_processed"] += 1
+                    processed += 1
+                    delivery_tag = method_frame.delivery_tag
+
+                    try:
+                        # Parse the message
+                        error_message = self.parse_error_message(body=body, method_frame=method_frame, header_frame=header_frame)
+
+                        original_payload = error_message.payload
+                        source_exchange = error_message.exchange
+                        source_queue = error_message.routing_key
+                        service_name = error_message.service_name
+
+                        # Validate
+                        if not original_payload or not source_exchange or not source_queue:
+                            log.error("Missing required info in message %s", delivery_tag)
+                            channel.basic_reject(delivery_tag, requeue=True)
+                            results["failed"] += 1
+                            continue
+
+                        # Apply service filter
+                        if service_filter and service_name not in service_filter:
+                            channel.basic_reject(delivery_tag, requeue=True)
+                            results["skipped"] += 1
+                            continue
+
+                        # Resend the original payload
+                        success = self._resend_single_message(
+                            channel=channel,
+                            delivery_tag=delivery_tag,
+                            payload=original_payload,
+                            content_type=header_frame.content_type,
+                            source_exchange=source_exchange,
+                            source_queue=source_queue,
+                            error_message=error_message,
+                            remove_from_queue=remove_from_queue,
+                            resent_headers=resent_headers,
+                            resent_timestamp=resent_timestamp,
+                        )
+
+                        if success:
+                            results["successfully_resent"] += 1
+                            log.info("Resent message %s from %s", delivery_tag, service_name)
+                        else:
+                            results["failed"] += 1
+                            channel.basic_reject(delivery_tag, requeue=True)
+
+                    except Exception as e:
+                        log.error("Error processing message %s: %s", delivery_tag, e)
                         results["failed"] += 1
-                        continue
-
-                    # Apply service filter
-                    if service_filter and service_name not in service_filter:
                         channel.basic_reject(delivery_tag, requeue=True)
-                        results["skipped"] += 1
-                        continue
 
-                    # Resend the original payload
-                    success = self._resend_single_message(
-                        channel=channel,
-                        delivery_tag=delivery_tag,
-                        payload=original_payload,
-                        content_type=header_frame.content_type,
-                        source_exchange=source_exchange,
-                        source_queue=source_queue,
-                        error_message=error_message,
-                        remove_from_queue=remove_from_queue,
-                    )
-
-                    if success:
-                        results["successfully_resent"] += 1
-                        log.info(f"Resent message {delivery_tag} from {service_name}")
-                    else:
-                        results["failed"] += 1
-                        channel.basic_reject(delivery_tag, requeue=True)
-
-                except Exception as e:
-                    log.error(f"Error processing message {delivery_tag}: {e}")
-                    results["failed"] += 1
-                    channel.basic_reject(delivery_tag, requeue=True)
-
-        except Exception as e:
-            log.error(f"Error in resend_messages: {e}")
-        finally:
-            if channel and channel.is_open:
-                channel.connection.close()
+            except Exception as e:
+                log.error("Error in resend_messages: %s", e)
+            finally:
+                self.invalidate()
 
-        log.info(f"Resend operation completed: {results}")
+        log.info("Resend operation completed: %s", results)
         return results
 
     def discard_messages(self, service_filter: Optional[List[str]] = None, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Discard messages from error queue.
         """
-        channel = self.get_channel()
         results = {
             "total_processed": 0,
             "discarded": 0,
             "skipped": 0,
         }
 
-        try:
-            processed = 0
+        with self._channel() as channel:
+            try:
+                processed = 0
 
-            while True:
-                if limit and processed >= limit:
-                    break
+                while True:
+                    if limit and processed >= limit:
+                        break
 
-                method_frame, header_frame, body = channel.basic_get(queue=self.error_queue.name, auto_ack=False)
+                    method_frame, header_frame, body = channel.basic_get(queue=self._queue_name, auto_ack=False)
 
-                if not method_frame:
-                    break
+                    if not method_frame:
+                        break
 
-                results["total_processed"] += 1
-                processed += 1
-                delivery_tag = method_frame.delivery_tag
+                    results["total_processed"] += 1
+                    processed += 1
+                    delivery_tag = method_frame.delivery_tag
 
-                try:
-                    # Parse the message (for logging/record keeping)
-                    error_message = self.parse_error_message(body=body, method_frame=method_frame, header_frame=header_frame)
+                    try:
+                        # Parse the message (for logging/record keeping)
+                        error_message = self.parse_error_message(body=body, method_frame=method_frame, header_frame=header_frame)
 
-                    if service_filter is not None and error_message.service_name not in service_filter:
-                        channel.basic_reject(delivery_tag, requeue=True)
-                        results["skipped"] += 1
-                        continue
+                        if service_filter is not None and error_message.service_name not in service_filter:
+                            channel.basic_reject(delivery_tag, requeue=True)
+                            results["skipped"] += 1
+                            continue
 
-                    channel.basic_ack(delivery_tag)
-                    results["discarded"] += 1
-                    log.info(f"Discarded message {delivery_tag}")
+                        channel.basic_ack(delivery_tag)
+                        results["discarded"] += 1
+                        log.info("Discarded message %s", delivery_tag)
 
-                except Exception as e:
-                    log.error(f"Error processing message {delivery_tag}: {e}")
-                    channel.basic_reject(delivery_tag, requeue=True)
+                    except Exception as e:
+                        log.error("Error processing message %s: %s", delivery_tag, e)
+                        channel.basic_reject(delivery_tag, requeue=True)
 
-        except Exception as e:
-            log.error(f"Error in discard_messages: {e}")
-        finally:
-            if channel and channel.is_open:
-                channel.connection.close()
+            except Exception as e:
+                log.error("Error in discard_messages: %s", e)
+            finally:
+                self.invalidate()
 
-        log.info(f"Discard operation completed: {results}")
+        log.info("Discard operation completed: %s", results)
         return results
 
+    @staticmethod
+    def _resend_markers() -> Tuple[Dict[str, Any], int]:
+        """Resend headers and AMQP timestamp, computed from a single wall-clock read"""
+        now = time.time()
+        return {"x-resent": True, "x-resent-timestamp": str(now)}, int(now)
+
     @staticmethod
     def _resend_single_message(
         channel: BlockingChannel,
@@ -287,37 +355,40 @@ class RabbitMQPeeker:
         source_queue: str,
         error_message: Optional[ErrorMessage] = None,
         remove_from_queue: bool = True,
+        resent_headers: Optional[Dict[str, Any]] = None,
+        resent_timestamp: Optional[int] = None,
     ) -> bool:
         """
         Resend a single original payload to its original destination.
+        ``resent_headers``/``resent_timestamp`` let batch callers compute the resend markers once;
+        the headers dict is shared and only copied when a tenant header must be added.
         """
         try:
-            log.info(f"Resending to {source_exchange}::{source_queue}")
-            body = json.dumps(payload).encode("utf-8")
+            log.info("Resending to %s::%s", source_exchange, source_queue)
+            body = json_tools.dumps(payload)
 
-            headers = {
-                "x-resent": True,
-                "x-resent-timestamp": str(time.time()),
-            }
+            if resent_headers is None or resent_timestamp is None:
+                resent_headers, resent_timestamp = RabbitMQPeeker._resend_markers()
 
+            headers = resent_headers
             if error_message and error_message.tenant_id:
-                headers["x-tenant-id"] = error_message.tenant_id
+                headers = {**resent_headers, "x-tenant-id": error_message.tenant_id}
 
             properties = pika.BasicProperties(
                 content_type=content_type or "application/json",
                 delivery_mode=2,  # Persistent
                 headers=headers,
                 message_id=error_message.message_id if error_message else None,
-                timestamp=int(time.time()),
+                timestamp=resent_timestamp,
             )
 
             channel.basic_publish(exchange=source_exchange, routing_key=source_queue, body=body, properties=properties)
 
             if remove_from_queue:
                 channel.basic_ack(delivery_tag)
-            log.info(f"Successfully resent to {source_exchange}::{source_queue}")
+            log.info("Successfully resent to %s::%s", source_exchange, source_queue)
             return True
 
         except Exception as e:
-            log.error(f"Failed to resend message {delivery_tag} to {source_exchange}::{source_queue}: {e}")
+            log.error("Failed to resend message %s to %s::%s: %s", delivery_tag, source_exchange, source_queue, e)
             return False
@@ -1,13 +1,14 @@
 import asyncio
-import json
+import weakref
 from typing import Any, Dict, List, Optional
 
 from aio_pika import ExchangeType, Message, connect
-from aio_pika.abc import AbstractChannel, AbstractConnection
+from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange
 from aio_pika.pool import Pool
 from faststream.rabbit import RabbitExchange
 
 from dynafield.logger.logger_config import get_logger
+from dynafield.utils import json_tools
 
 log = get_logger(__name__)
 
@@ -26,6 +27,9 @@ class AMQPublisher:
         self._channel_pool: Optional[Pool[AbstractChannel]] = None
         self._is_initialized = False
         self.exchanges: List[RabbitExchange] = exchanges
+        self._exchange_by_name: Dict[str, RabbitExchange] = {e.name: e for e in exchanges}
+        # Declared exchanges per pooled channel; entries go away with the channel
+        self._declared: weakref.WeakKeyDictionary[AbstractChannel, Dict[str, AbstractExchange]] = weakref.WeakKeyDictionary()
 
         if connection_params is not None:
             self._connection_params = connection_params
@@ -72,6 +76,21 @@ class AMQPublisher:
         async with self._connection_pool.acquire() as connection:
             return await connection.channel(publisher_confirms=True)
 
+    async def _get_declared_exchange(self, channel: AbstractChannel, exchange: str) -> AbstractExchange:
+        """Declare a configured exchange once per channel and reuse it afterwards"""
+        declared = self._declared.setdefault(channel, {})
+        exchange_obj_declared = declared.get(exchange)
+        if exchange_obj_declared is not None:
+            return exchange_obj_declared
+
+        exchange_obj = self._exchange_by_name.get(exchange)
+        if exchange_obj is None:
+            raise ValueError(f"Exchange '{exchange}' not found in configured exchanges.")
+
+        exchange_obj_declared = await channel.declare_exchange(exchange_obj.name, type=ExchangeType(exchange_obj.type.value), durable=exchange_obj.durable)
+        declared[exchange] = exchange_obj_declared
+        return exchange_obj_declared
+
     async def publish(
         self,
         data: Dict[str, Any],
@@ -90,19 +109,13 @@ class AMQPublisher:
             async with self._channel_pool.acquire() as channel:
                 # Idempotent
                 message = Message(
-                    body=json.dumps(data).encode(),
+                    body=json_tools.dumps(data),
                     content_type="application/json",
                     delivery_mode=2,  # Persistent,
                     type=msg_type,
                 )
 
-                exchange_obj = next((e for e in self.exchanges if e.name == exchange), None)
-                if exchange_obj is None:
-                    raise ValueError(f"Exchange '{exchange}' not found in configured exchanges.")
-
-                exchange_obj_declared = await channel.declare_exchange(
-                    exchange_obj.name, type=ExchangeType(exchange_obj.type.value), durable=exchange_obj.durable
-                )
+                exchange_obj_declared = await self._get_declared_exchange(channel, exchange)
 
                 if require_confirm:
                     confirm = await exchange_obj_declared.publish(message, routing_key, timeout=5.0)
@@ -131,4 +144,5 @@ class AMQPublisher:
         if self._connection_pool:
             await self._connection_pool.close()
         self._is_initialized = False
+        self._declared.clear()
         log.info("✅ RabbitMQ pools closed")
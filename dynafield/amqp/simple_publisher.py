@@ -1,13 +1,16 @@
 import asyncio
-import json
-from typing import Any, Dict, Optional, Set, Tuple
+import time
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Set, Tuple
 
-from aio_pika import ExchangeType, Message, connect
-from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange, AbstractQueue
+from aio_pika import ExchangeType, Message, connect_robust
+from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange, AbstractQueue, AbstractRobustConnection
 from aio_pika.pool import Pool
 from pika.exceptions import AMQPError
 
 from dynafield.logger.logger_config import get_logger
+from dynafield.utils import json_tools, msgpack_tools
 
 log = get_logger(__name__)
 
@@ -19,48 +22,152 @@ _default_connection_params = {
     "password": "guest",
 }
 
+Serializer = Literal["json", "msgpack"]
+
+# How long a successful passive exchange probe is trusted before asking the broker again
+PASSIVE_PROBE_TTL = 5.0
+
+
+def _build_message(data: Dict[str, Any], msg_type: Optional[str], serializer: Serializer) -> Message:
+    if serializer == "msgpack":
+        body, content_type = msgpack_tools.packb(data), msgpack_tools.MSGPACK_CONTENT_TYPE
+    else:
+        body, content_type = json_tools.dumps(data), "application/json"
+    return Message(
+        body=body,
+        content_type=content_type,
+        delivery_mode=2,  # Persistent
+        type=msg_type,
+    )
+
+
+async def _send(exchange_obj: AbstractExchange, message: Message, routing_key: str, require_confirm: bool) -> bool:
+    """Publish one message on an already resolved exchange and log the outcome"""
+    exchange = exchange_obj.name
+    try:
+        if require_confirm:
+            confirm = await exchange_obj.publish(
+                message,
+                routing_key=routing_key,
+                timeout=5.0,  # 5 second timeout for confirmation
+            )
+            if confirm:
+                log.debug("CONFIRMED: %s::%s", exchange, routing_key)
+                return True
+            else:
+                log.error("NOT CONFIRMED: %s::%s", exchange, routing_key)
+                return False
+        else:
+            await exchange_obj.publish(message, routing_key=routing_key)
+            log.debug("📤 SENT: %s::%s", exchange, routing_key)
+            return True
+
+    except asyncio.TimeoutError:
+        log.error("CONFIRM TIMEOUT: %s::%s", exchange, routing_key)
+        return False
+    except Exception as e:
+        log.error("PUBLISH FAILED: %s::%s - %s", exchange, routing_key, e)
+        return False
+
+
+class PublisherSession:
+    """Publishes on one pinned channel and exchange, see AMQPSimplePublisher.publisher_session"""
+
+    def __init__(self, exchange_obj: AbstractExchange) -> None:
+        self._exchange_obj = exchange_obj
+
+    async def publish(
+        self,
+        data: Dict[str, Any],
+        routing_key: str,
+        require_confirm: bool = True,
+        msg_type: Optional[str] = None,
+        serializer: Serializer = "json",
+    ) -> bool:
+        return await _send(self._exchange_obj, _build_message(data, msg_type, serializer), routing_key, require_confirm)
+
 
 class AMQPSimplePublisher:
-    def __init__(self, connection_params: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, Any]] = None,
+        max_connections: int = 2,
+        channels_per_connection: int = 16,
+        warm_up: bool = True,
+    ) -> None:
+        """
+        Few connections, many channels: channels are multiplexed over the pooled connections,
+        so the channel pool holds max_connections * channels_per_connection channels.
+        """
+        self._max_connections = max_connections
+        self._max_channels = max_connections * channels_per_connection
+        self._warm_up = warm_up
         self._connection_pool: Optional[Pool[AbstractConnection]] = None
         self._channel_pool: Optional[Pool[AbstractChannel]] = None
         self._is_initialized = False
-        self._declared_exchanges: Set[str] = set()
+        # Declared exchange/queue objects per pooled channel, dropped when the channel closes
+        self._exchange_cache: weakref.WeakKeyDictionary[AbstractChannel, Dict[str, AbstractExchange]] = weakref.WeakKeyDictionary()
+        self._queue_cache: weakref.WeakKeyDictionary[AbstractChannel, Dict[str, AbstractQueue]] = weakref.WeakKeyDictionary()
+        # publish_nowait futures whose confirm has not resolved yet
+        self._outstanding: Set["asyncio.Future[bool]"] = set()
+        # exchange name -> monotonic time until which its last passive probe is trusted
+        self._passive_probe_cache: Dict[str, float] = {}
 
         if connection_params is not None:
             self._connection_params = connection_params
         else:
             self._connection_params = _default_connection_params
 
+        # Validated once here so every (re)connect just splats the same kwargs
+        host: str | None = self._connection_params.get("host")
+        port: int | None = self._connection_params.get("port")
+        if host is None or port is None:
+            raise ValueError("Invalid connection parameters for RabbitMQ")
+        self._connect_kwargs: Dict[str, Any] = {
+            "host": host,
+            "port": port,
+            "virtualhost": self._connection_params.get("virtualhost", "/"),
+            "login": self._connection_params.get("login", "guest"),
+            "password": self._connection_params.get("password", "guest"),
+        }
+
     async def initialize(self) -> None:
         """Initialize connection pools - call this once at app startup"""
         if self._is_initialized:
             return
 
-        self._connection_pool = Pool(self._create_connection, max_size=10, loop=asyncio.get_event_loop())
+        self._connection_pool = Pool(self._create_connection, max_size=self._max_connections, loop=asyncio.get_event_loop())
 
-        self._channel_pool = Pool(self._create_channel, max_size=50, loop=asyncio.get_event_loop())
+        self._channel_pool = Pool(self._create_channel, max_size=self._max_channels, loop=asyncio.get_event_loop())
 
         self._is_initialized = True
-        log.info("✅ RabbitMQ pools initialized")
+        if self._warm_up:
+            await self._warm_up_pools()
+        log.info(f"✅ RabbitMQ pools initialized ({self._max_connections} connections, {self._max_channels} channels)")
 
-    async def _create_connection(self) -> AbstractConnection:
-        host: str | None = self._connection_params.get("host")
-        port: int | None = self._connection_params.get("port")
-        virtualhost: str = self._connection_params.get("virtualhost", "/")
-        login: str = self._connection_params.get("login", "guest")
-        password: str = self._connection_params.get("password", "guest")
-        log.info(f"Creating RabbitMQ connection to {host}:{port}")
-        if host is None or port is None:
-            raise ValueError("Invalid connection parameters for RabbitMQ")
+    async def _warm_up_pools(self) -> None:
+        """Open every pooled connection (with one channel each) now, so the first publishes don't pay for the handshakes"""
+        if self._connection_pool is None or self._channel_pool is None:
+            return
+        try:
+            # Holding the connections at once forces the pool to open all of them instead of reusing a released one
+            async with AsyncExitStack() as stack:
+                await asyncio.gather(*[stack.enter_async_context(self._connection_pool.acquire()) for _ in range(self._max_connections)])
+            # Released connections are handed out FIFO, so these channels land on different connections
+            async with AsyncExitStack() as stack:
+                await asyncio.gather(*[stack.enter_async_context(self._channel_pool.acquire()) for _ in range(self._max_connections)])
+        except Exception as e:
+            # Not fatal: the pools still create connections lazily on first acquire
+            log.warning(f"RabbitMQ pool warm-up failed: {e}")
 
-        return await connect(
-            host=host,
-            port=port,
-            virtualhost=virtualhost,
-            login=login,
-            password=password,
-        )
+    def _probe_is_fresh(self, exchange: str) -> bool:
+        return time.monotonic() < self._passive_probe_cache.get(exchange, 0.0)
+
+    async def _create_connection(self) -> AbstractConnection:
+        log.info(f"Creating RabbitMQ connection to {self._connect_kwargs['host']}:{self._connect_kwargs['port']}")
+        # Robust connections reconnect (and restore their channels) in place, so pooled objects stay valid
+        connection: AbstractRobustConnection = await connect_robust(**self._connect_kwargs)
+        return connection
 
     async def _create_channel(self) -> AbstractChannel:
         if self._connection_pool is None:
@@ -68,18 +175,38 @@ class AMQPSimplePublisher:
         async with self._connection_pool.acquire() as connection:
             return await connection.channel(publisher_confirms=True)
 
+    def _channel_caches(self, channel: AbstractChannel) -> Tuple[Dict[str, AbstractExchange], Dict[str, AbstractQueue]]:
+        """Per-channel declaration caches, registering the close hook the first time a channel is seen"""
+        exchanges = self._exchange_cache.get(channel)
+        if exchanges is None:
+            exchanges = self._exchange_cache[channel] = {}
+            self._queue_cache[channel] = {}
+            channel.close_callbacks.add(self._forget_channel)
+        return exchanges, self._queue_cache[channel]
+
+    def _forget_channel(self, channel: Optional[AbstractChannel], *args: Any) -> None:
+        if channel is not None:
+            self._exchange_cache.pop(channel, None)
+            self._queue_cache.pop(channel, None)
+
     async def _get_exchange(self, channel: AbstractChannel, exchange: str, exchange_type: str = "topic") -> AbstractExchange:
-        """Get or declare exchange object"""
+        """Get or declare exchange object, reusing the one already resolved on this channel"""
+        exchanges, _ = self._channel_caches(channel)
+        cached = exchanges.get(exchange)
+        if cached is not None:
+            return cached
+
         try:
             # Try to get existing exchange first
             exchange_obj = await channel.get_exchange(exchange)
-            log.debug(f"Using existing exchange: {exchange}")
+            log.debug("Using existing exchange: %s", exchange)
+            exchanges[exchange] = exchange_obj
             return exchange_obj
         except Exception:
             # If exchange doesn't exist, declare it
             try:
                 exchange_obj = await channel.declare_exchange(exchange, type=ExchangeType(exchange_type), durable=True)
-                self._declared_exchanges.add(exchange)
+                exchanges[exchange] = exchange_obj
                 log.info(f"Declared new exchange: {exchange} ({exchange_type})")
                 return exchange_obj
             except Exception as e:
@@ -94,9 +221,11 @@ class AMQPSimplePublisher:
         require_confirm: bool = True,
         msg_type: Optional[str] = None,
         exchange_type: str = "topic",
+        serializer: Serializer = "json",
     ) -> bool:
         """
-        Simple publishing using exchange name as string
+        Simple publishing using exchange name as string.
+        serializer="msgpack" is meant for internal producer/consumer pairs; keep JSON for external consumers.
         """
         if not self._is_initialized:
             raise RuntimeError("Publisher not initialized. Call initialize() first.")
@@ -106,41 +235,109 @@ class AMQPSimplePublisher:
 
         try:
             async with self._channel_pool.acquire() as channel:
-                # Create message
-                message = Message(
-                    body=json.dumps(data).encode(),
-                    content_type="application/json",
-                    delivery_mode=2,  # Persistent
-                    type=msg_type,
-                )
-
-                # Get exchange object
+                message = _build_message(data, msg_type, serializer)
                 exchange_obj = await self._get_exchange(channel, exchange, exchange_type)
+                return await _send(exchange_obj, message, routing_key, require_confirm)
+        except Exception as e:
+            log.error(f"PUBLISH FAILED: {exchange}::{routing_key} - {str(e)}")
+            return False
 
-                # Publish using the exchange object
-                if require_confirm:
-                    confirm = await exchange_obj.publish(
-                        message,
-                        routing_key=routing_key,
-                        timeout=5.0,  # 5 second timeout for confirmation
-                    )
-                    if confirm:
-                        log.info(f"CONFIRMED: {exchange}::{routing_key}")
-                        return True
-                    else:
-                        log.error(f"NOT CONFIRMED: {exchange}::{routing_key}")
-                        return False
-                else:
-                    await exchange_obj.publish(message, routing_key=routing_key)
-                    log.info(f"📤 SENT: {exchange}::{routing_key}")
-                    return True
+    def publish_nowait(
+        self,
+        data: Dict[str, Any],
+        exchange: str,
+        routing_key: str,
+        msg_type: Optional[str] = None,
+        exchange_type: str = "topic",
+        serializer: Serializer = "json",
+    ) -> "asyncio.Future[bool]":
+        """
+        Schedule a confirmed publish and return immediately with a future for its outcome.
+        Confirms resolve in the background; call drain() at a checkpoint to wait for all of them.
+        """
+        if not self._is_initialized:
+            raise RuntimeError("Publisher not initialized. Call initialize() first.")
+
+        future = asyncio.ensure_future(self.publish(data, exchange, routing_key, msg_type=msg_type, exchange_type=exchange_type, serializer=serializer))
+        self._outstanding.add(future)
+        future.add_done_callback(self._outstanding.discard)
+        return future
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every outstanding publish_nowait confirm.
+        Returns True only if all of them were confirmed within the timeout.
+        """
+        if not self._outstanding:
+            return True
 
-        except asyncio.TimeoutError:
-            log.error(f"CONFIRM TIMEOUT: {exchange}::{routing_key}")
+        done, pending = await asyncio.wait(set(self._outstanding), timeout=timeout)
+        if pending:
+            log.error(f"DRAIN TIMEOUT: {len(pending)} publishes still unconfirmed")
             return False
+        return all(not future.cancelled() and future.exception() is None and future.result() for future in done)
+
+    @asynccontextmanager
+    async def publisher_session(self, exchange: str, exchange_type: str = "topic") -> AsyncIterator["PublisherSession"]:
+        """
+        Pin one pooled channel and its exchange for a stream of publishes from a single task.
+        session.publish then skips the pool acquire and the exchange lookup for every message.
+        """
+        if not self._is_initialized:
+            raise RuntimeError("Publisher not initialized. Call initialize() first.")
+
+        if self._channel_pool is None:
+            raise RuntimeError("Channel pool not initialized")
+
+        async with self._channel_pool.acquire() as channel:
+            exchange_obj = await self._get_exchange(channel, exchange, exchange_type)
+            yield PublisherSession(exchange_obj)
+
+    async def publish_many(
+        self,
+        items: Sequence[Tuple[Dict[str, Any], str, Optional[str]]],
+        exchange: str,
+        require_confirm: bool = True,
+        exchange_type: str = "topic",
+        serializer: Serializer = "json",
+    ) -> List[bool]:
+        """
+        Publish a batch of (data, routing_key, msg_type) items on a single channel.
+        Every message is sent before any confirm is awaited, so the batch costs about one broker round-trip.
+        Returns one success flag per item, in input order.
+        """
+        if not self._is_initialized:
+            raise RuntimeError("Publisher not initialized. Call initialize() first.")
+
+        if self._channel_pool is None:
+            raise RuntimeError("Channel pool not initialized")
+
+        if not items:
+            return []
+
+        try:
+            async with self._channel_pool.acquire() as channel:
+                exchange_obj = await self._get_exchange(channel, exchange, exchange_type)
+                messages: List[Tuple[Message, str]] = []
+                for data, routing_key, msg_type in items:
+                    messages.append((_build_message(data, msg_type, serializer), routing_key))
+
+                # publisher_confirms channel pipelines the basic.publish frames and resolves acks by delivery tag
+                confirms = await asyncio.gather(
+                    *[exchange_obj.publish(message, routing_key=routing_key, timeout=5.0) for message, routing_key in messages],
+                    return_exceptions=True,
+                )
         except Exception as e:
-            log.error(f"PUBLISH FAILED: {exchange}::{routing_key} - {str(e)}")
-            return False
+            log.error(f"PUBLISH BATCH FAILED: {exchange} ({len(items)} messages) - {str(e)}")
+            return [False] * len(items)
+
+        results = [not isinstance(confirm, BaseException) and (bool(confirm) or not require_confirm) for confirm in confirms]
+        failed = results.count(False)
+        if failed:
+            log.error(f"NOT CONFIRMED: {failed}/{len(items)} messages to {exchange}")
+        else:
+            log.debug("CONFIRMED: %d messages to %s", len(items), exchange)
+        return results
 
     async def _get_queue(
         self,
@@ -155,18 +352,23 @@ class AMQPSimplePublisher:
         Get or declare queue object with passive declaration first.
         This is safe for queues that may already exist with different properties.
         """
+        _, queues = self._channel_caches(channel)
+        cached = queues.get(queue)
+        if cached is not None:
+            return cached
+
         try:
             # First try to get the queue passively (won't change properties if it exists)
             try:
                 queue_obj = await channel.get_queue(queue, ensure=False)
-                log.debug(f"Using existing queue: {queue}")
-                return queue_obj
+                log.debug("Using existing queue: %s", queue)
             except AMQPError:
                 # If queue doesn't exist, declare it with specified properties
                 log.debug(f"Queue {queue} doesn't exist, declaring with durable={durable}")
                 queue_obj = await channel.declare_queue(name=queue, durable=durable, exclusive=exclusive, auto_delete=auto_delete, arguments=arguments)
                 log.info(f"Declared new queue: {queue} (durable={durable})")
-                return queue_obj
+            queues[queue] = queue_obj
+            return queue_obj
         except Exception as e:
             log.error(f"Failed to handle queue {queue}: {e}")
             raise
@@ -185,17 +387,21 @@ class AMQPSimplePublisher:
         if self._channel_pool is None:
             raise RuntimeError("Channel pool not initialized")
 
+        if passive and self._probe_is_fresh(exchange):
+            return True
+
         try:
             async with self._channel_pool.acquire() as channel:
                 if passive:
                     # Just check if exchange exists
                     _exchange_obj = await channel.get_exchange(exchange)
+                    self._passive_probe_cache[exchange] = time.monotonic() + PASSIVE_PROBE_TTL
                     log.debug(f"Exchange exists: {exchange}")
                     return True
                 else:
                     # Try to declare with specified properties
-                    _exchange_obj = await channel.declare_exchange(name=exchange, type=ExchangeType(exchange_type), durable=durable, auto_delete=auto_delete)
-                    self._declared_exchanges.add(exchange)
+                    exchange_obj = await channel.declare_exchange(name=exchange, type=ExchangeType(exchange_type), durable=durable, auto_delete=auto_delete)
+                    self._channel_caches(channel)[0][exchange] = exchange_obj
                     log.info(f"Exchange declared: {exchange} ({exchange_type}, durable={durable})")
                     return True
         except Exception as e:
@@ -311,6 +517,33 @@ class AMQPSimplePublisher:
             log.error(f"Failed to bind queue {queue} to exchange {exchange}")
             return False
 
+    async def _setup_on_channel(
+        self,
+        channel: AbstractChannel,
+        exchange: str,
+        queue: str,
+        routing_key: str,
+        exchange_type: str,
+        exchange_durable: bool,
+        exchange_auto_delete: bool,
+        queue_durable: bool,
+        queue_exclusive: bool,
+        queue_auto_delete: bool,
+        bind_arguments: Optional[Dict[str, Any]],
+        queue_arguments: Optional[Dict[str, Any]],
+    ) -> None:
+        """Declare the exchange and queue and bind them on one channel; raises on the first failure"""
+        exchanges, queues = self._channel_caches(channel)
+        exchange_obj = await channel.declare_exchange(
+            name=exchange, type=ExchangeType(exchange_type), durable=exchange_durable, auto_delete=exchange_auto_delete
+        )
+        exchanges[exchange] = exchange_obj
+        queue_obj = await channel.declare_queue(
+            name=queue, durable=queue_durable, exclusive=queue_exclusive, auto_delete=queue_auto_delete, arguments=queue_arguments
+        )
+        queues[queue] = queue_obj
+        await queue_obj.bind(exchange_obj, routing_key, arguments=bind_arguments)
+
     async def setup_exchange_and_queue(
         self,
         exchange: str,
@@ -329,6 +562,30 @@ class AMQPSimplePublisher:
         Complete setup: declare exchange, declare queue, and bind them.
         Returns tuple of (exchange_handled, queue_handled, binding_handled)
         """
+        if self._is_initialized and self._channel_pool is not None:
+            try:
+                # Common case: everything declares cleanly, so do all three on one channel
+                async with self._channel_pool.acquire() as channel:
+                    await self._setup_on_channel(
+                        channel,
+                        exchange=exchange,
+                        queue=queue,
+                        routing_key=routing_key,
+                        exchange_type=exchange_type,
+                        exchange_durable=exchange_durable,
+                        exchange_auto_delete=exchange_auto_delete,
+                        queue_durable=queue_durable,
+                        queue_exclusive=queue_exclusive,
+                        queue_auto_delete=queue_auto_delete,
+                        bind_arguments=bind_arguments,
+                        queue_arguments=queue_arguments,
+                    )
+                log.info(f"Exchange '{exchange}' and queue '{queue}' declared and bound with routing key '{routing_key}'")
+                return True, True, True
+            except Exception as e:
+                # A broker error (e.g. PRECONDITION_FAILED) closes the channel, so redo it step by step below
+                log.warning(f"Single-channel setup of exchange '{exchange}' and queue '{queue}' failed, retrying step by step: {e}")
+
         try:
             # Handle exchange (declared or already exists)
             exchange_result = await self.declare_exchange(
@@ -363,18 +620,25 @@ class AMQPSimplePublisher:
 
     async def close(self) -> None:
         """Close all pools - call this at app shutdown"""
+        # Let in-flight publish_nowait confirms land before the channels go away
+        await self.drain(timeout=5.0)
         if self._channel_pool:
             await self._channel_pool.close()
         if self._connection_pool:
             await self._connection_pool.close()
         self._is_initialized = False
-        self._declared_exchanges.clear()
+        self._exchange_cache.clear()
+        self._queue_cache.clear()
+        self._passive_probe_cache.clear()
         log.info("✅ RabbitMQ pools closed")
 
     async def readiness_ping(self, timeout: float = 0.5, probe_exchange: str = "amq.topic") -> bool:
         if not self._is_initialized or self._channel_pool is None:
             return False
 
+        if self._probe_is_fresh(probe_exchange):
+            return True
+
         async def _probe() -> bool:
             async with self._channel_pool.acquire() as channel:  # type: ignore # already checking self._channel_pool for None above, mypy can't resolve it
                 await channel.declare_exchange(
@@ -383,6 +647,7 @@ class AMQPSimplePublisher:
                     passive=True,
                     durable=True,
                 )
+                self._passive_probe_cache[probe_exchange] = time.monotonic() + PASSIVE_PROBE_TTL
                 return True
 
         try:
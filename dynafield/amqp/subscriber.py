@@ -1,10 +1,11 @@
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Callable, List, Optional
 
 from faststream.rabbit import RabbitBroker, RabbitExchange, RabbitMessage, RabbitQueue
 
 from dynafield.logger.logger_config import get_logger
+from dynafield.utils import msgpack_tools
 from dynafield.utils.formating import parse_structured_traceback
 
 log = get_logger(__name__)
@@ -64,13 +65,22 @@ class AmqpSubscriber:
         if self.broker is None:
             raise RuntimeError("Broker not initialized")
 
+        # Per-message invariants, resolved once for the handler closure
+        broker = self.broker
+        queue_name = queue.name
+        exchange_name = exchange.name
+
         async def handler_with_retry(
-            data: dict[str, Any],
+            data: Any,
             message: RabbitMessage,
         ) -> Any | None:
+            # faststream only decodes JSON bodies, msgpack ones arrive as raw bytes
+            is_msgpack = message.content_type == msgpack_tools.MSGPACK_CONTENT_TYPE
+            if is_msgpack:
+                data = msgpack_tools.unpackb(message.body)
             headers = message.headers or {}
             retry_count = headers.get("x-retry-count", 0)
-            log.debug(f"🎯 Processing - Retry count: {retry_count}")
+            log.debug("🎯 Processing - Retry count: %s", retry_count)
             try:
                 result = await func(data)
                 await message.ack()
@@ -78,22 +88,30 @@ class AmqpSubscriber:
                 return result
 
             except Exception as e:
-                log.error(f"❌ Failed: {e}")
+                log.error("❌ Failed: %s", e)
                 if retry_count < max_retries:
                     backoff_seconds = (retry_count + 1) * backoff_factor
-                    log.debug(f"⏰ Waiting {backoff_seconds}s before retry...")
+                    log.debug("⏰ Waiting %ss before retry...", backoff_seconds)
                     await asyncio.sleep(backoff_seconds)
 
-                    new_headers = {**headers, "x-retry-count": retry_count + 1}
-                    if self.broker is None:
-                        raise RuntimeError("Broker not initialized for retry publishing")
-                    routing_key = message.raw_message.routing_key
+                    new_headers = headers | {"x-retry-count": retry_count + 1}
+                    raw_message = message.raw_message
+                    routing_key = raw_message.routing_key
                     if routing_key is None:
                         raise ValueError("Routing key is None in the original message")
-                    await self.broker.publish(data, exchange=message.raw_message.exchange, routing_key=routing_key, headers=new_headers)
+                    if is_msgpack:
+                        await broker.publish(
+                            msgpack_tools.packb(data),
+                            exchange=raw_message.exchange,
+                            routing_key=routing_key,
+                            headers=new_headers,
+                            content_type=msgpack_tools.MSGPACK_CONTENT_TYPE,
+                        )
+                    else:
+                        await broker.publish(data, exchange=raw_message.exchange, routing_key=routing_key, headers=new_headers)
 
                     await message.ack()
-                    log.debug(f"🔄 Retry {retry_count + 1} scheduled")
+                    log.debug("🔄 Retry %s scheduled", retry_count + 1)
 
                 else:
                     # Capture detailed error information
@@ -103,18 +121,18 @@ class AmqpSubscriber:
                     error_data = {
                         "payload": data,
                         "error_info": structured_tb,
-                        "source_queue": queue.name,
-                        "source_exchange": exchange.name,
+                        "source_queue": queue_name,
+                        "source_exchange": exchange_name,
                         "_metadata": {
                             "final_failure": True,
                             "retries": retry_count + 1,
                             "error": str(e),
-                            "failed_at": datetime.utcnow().isoformat(),
+                            "failed_at": datetime.now(timezone.utc).isoformat(),
                         },
                     }
 
-                    if error_exchange and error_routing_key and self.broker:
-                        await self.broker.publish(error_data, exchange=error_exchange, routing_key=error_routing_key)
+                    if error_exchange and error_routing_key:
+                        await broker.publish(error_data, exchange=error_exchange, routing_key=error_routing_key)
 
                     await message.ack()
             return None
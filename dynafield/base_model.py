@@ -1,26 +1,30 @@
 import datetime
 import enum
-import json
 import uuid
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator
 
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel as pyBaseModel
 from pydantic import ConfigDict, ValidationError
 
+from dynafield.utils import json_tools
+
 
 class CustomJSONResponse(JSONResponse):
     def render(self, content: Any) -> bytes:
-        serializable_content = serialize_values(content)
-        return json.dumps(serializable_content, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        if json_tools.HAS_ORJSON:
+            # Single C-level pass: orjson encodes enums/UUIDs/datetimes itself and only calls back for our models
+            return json_tools.dumps(content, default=_json_default)
+        # stdlib json can't take enum/UUID dict keys, so normalize the whole tree first
+        return json_tools.dumps(serialize_values(content), allow_nan=False)
 
 
 def custom_json_serializer(obj: object) -> str:
-    return json.dumps(serialize_values(obj))
+    return json_tools.dumps(serialize_values(obj)).decode("utf-8")
 
 
 def custom_json_deserializer(s: str) -> Any:
-    return json.loads(s)
+    return json_tools.loads(s)
 
 
 class BaseModel(pyBaseModel):
@@ -30,13 +34,6 @@ class BaseModel(pyBaseModel):
         arbitrary_types_allowed=True,
     )
 
-    def __init__(self, **kwargs: Any):
-        """
-
-        @rtype: object
-        """
-        super().__init__(**kwargs)
-
     def dump(
         self,
         keep_data_types: bool = True,
@@ -56,12 +53,35 @@ class BaseModel(pyBaseModel):
         exclude_unset: bool = False,  # default True is usually what you want
         exclude_none: bool = True,
     ) -> "BaseModel":
+        # Shallow copy is enough: every merge rule below builds a new container or model instead of mutating current
+        result = self.model_copy(deep=False)
+        for name, _, merged_val in self._merged_fields(other, exclude_unset=exclude_unset, exclude_none=exclude_none):
+            setattr(result, name, merged_val)
+        return result
+
+    def update_from(
+        self,
+        other: "BaseModel",
+        *,
+        exclude_unset: bool = False,
+        exclude_none: bool = True,
+    ) -> "BaseModel":
+        updates = {
+            name: merged_val
+            for name, cur, merged_val in self._merged_fields(other, exclude_unset=exclude_unset, exclude_none=exclude_none)
+            if not (merged_val is cur or merged_val == cur)
+        }
+        # Merged values are built from two already-validated instances, so write them in bulk
+        # instead of paying validate_assignment per field
+        self.__dict__.update(updates)
+        self.__pydantic_fields_set__.update(updates)
+        return self
+
+    def _merged_fields(self, other: "BaseModel", *, exclude_unset: bool, exclude_none: bool) -> Iterator[tuple[str, Any, Any]]:
+        """Yield (field, current, merged) for every field other contributes to"""
         if type(self) is not type(other):
             raise TypeError(f"Cannot merge {type(other)} into {type(self)}")
 
-        # work on a deep copy so we don't mutate self
-        result = self.model_copy(deep=True)
-
         # only iterate fields we intend to update
         for name in type(self).model_fields:
             if exclude_unset and name not in other.model_fields_set:
@@ -71,23 +91,8 @@ class BaseModel(pyBaseModel):
             if exclude_none and inc is None:
                 continue
 
-            cur = getattr(result, name, None)
-            merged_val = self._merge_value(name, cur, inc)
-            setattr(result, name, merged_val)
-
-        return result
-
-    def update_from(
-        self,
-        other: "BaseModel",
-        *,
-        exclude_unset: bool = False,
-        exclude_none: bool = True,
-    ) -> "BaseModel":
-        merged = self.merged_with(other, exclude_unset=exclude_unset, exclude_none=exclude_none)
-        for name in type(self).model_fields:
-            setattr(self, name, getattr(merged, name))
-        return self
+            cur = getattr(self, name, None)
+            yield name, cur, self._merge_value(name, cur, inc)
 
     def _merge_value(self, field: str, current: Any, incoming: Any) -> Any:
         """
@@ -109,11 +114,20 @@ class BaseModel(pyBaseModel):
             return current.merged_with(incoming, exclude_unset=True, exclude_none=True)
 
         if isinstance(current, list) and isinstance(incoming, list):
-            to_add = []
-            for item in incoming:
-                if (item in to_add) or (item in current):
-                    continue
-                to_add.append(item)
+            try:
+                seen = set(current)
+                to_add = []
+                for item in incoming:
+                    if item not in seen:
+                        seen.add(item)
+                        to_add.append(item)
+            except TypeError:
+                # unhashable items (dicts, models): fall back to equality scans
+                to_add = []
+                for item in incoming:
+                    if (item in to_add) or (item in current):
+                        continue
+                    to_add.append(item)
             return current + to_add
         # default: replace
         return incoming
@@ -124,16 +138,29 @@ class BaseModel(pyBaseModel):
             return cls.model_validate(data)
         except ValidationError as e:
             values: dict[str, Any] = {}
-            # for each error, just set field to None
-            for err in e.errors():
+            # for each error, just set field to None; only loc is needed, so skip building urls/context/input copies
+            for err in e.errors(include_url=False, include_context=False, include_input=False):
                 field = err["loc"][0]
                 if isinstance(field, str):
                     values[field] = None
-            m = cls(**(data | values))
-            return m
+            # Second pass still validates so the fields that were fine get coerced as usual
+            return cls.model_validate(data | values)
+
+
+# Values json can encode as-is, and exact-type encoders, so common leaves skip json_encoder's isinstance chain
+_JSON_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+_ENCODERS_BY_TYPE: Dict[type, Callable[[Any], Any]] = {
+    uuid.UUID: str,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+}
 
 
 def json_encoder(value: Any, raiseIfNoMatch: bool = False, enum_as_name: bool = False) -> Any:
+    encoder = _ENCODERS_BY_TYPE.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    # Enums, models and subclasses have no exact-type entry
     if isinstance(value, enum.Enum):
         if enum_as_name:
             return value.name
@@ -152,14 +179,42 @@ def json_encoder(value: Any, raiseIfNoMatch: bool = False, enum_as_name: bool =
     return value
 
 
-def serialize_values(value: Any, enum_as_name: bool = False) -> Any:
-    if isinstance(value, dict):
-        serializedDict = {}
-        for dictKey, dictValue in value.items():
-            serializedKey = json_encoder(dictKey, enum_as_name=enum_as_name)
-            serializedDict[serializedKey] = serialize_values(dictValue, enum_as_name=enum_as_name)
-        return serializedDict
-    elif isinstance(value, list):
-        serializedList = list(map(lambda listValue: serialize_values(listValue, enum_as_name=enum_as_name), value))
-        return serializedList
+def _json_default(value: Any) -> Any:
+    return json_encoder(value, raiseIfNoMatch=True)
+
+
+def _encode_leaf(value: Any, enum_as_name: bool) -> Any:
+    value_type = type(value)
+    if value_type in _JSON_NATIVE_TYPES:
+        return value
+    encoder = _ENCODERS_BY_TYPE.get(value_type)
+    if encoder is not None:
+        return encoder(value)
+    # Enums, models and subclasses of the types above need the isinstance checks
     return json_encoder(value, enum_as_name=enum_as_name)
+
+
+def serialize_values(value: Any, enum_as_name: bool = False) -> Any:
+    if not isinstance(value, (dict, list)):
+        return _encode_leaf(value, enum_as_name)
+
+    root = [value]
+    # (container, key) slots that still hold an unserialized dict/list
+    pending: list[tuple[Any, Any]] = [(root, 0)]
+    while pending:
+        container, slot = pending.pop()
+        item = container[slot]
+        serialized: Any
+        if isinstance(item, dict):
+            serialized = {_encode_leaf(dictKey, enum_as_name): dictValue for dictKey, dictValue in item.items()}
+            children = serialized.items()
+        else:
+            serialized = list(item)
+            children = enumerate(serialized)
+        for childKey, childValue in children:
+            if isinstance(childValue, (dict, list)):
+                pending.append((serialized, childKey))
+            else:
+                serialized[childKey] = _encode_leaf(childValue, enum_as_name)
+        container[slot] = serialized
+    return root[0]
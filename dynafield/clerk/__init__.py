@@ -0,0 +1,26 @@
+import importlib
+from typing import Any
+
+# Submodules resolved on first attribute access (PEP 562), so importing the package loads none of them
+__all__ = [
+    "clerk_cache",
+    "jwks_cache",
+    "jwks_refresh",
+    "local_cache",
+    "production_auth",
+    "redis_client",
+    "token_verifier",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
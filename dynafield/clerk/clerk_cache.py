@@ -1,14 +1,32 @@
-import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from jwt import PyJWKClient
-from rediskit.redis.a_client import get_async_redis_connection
 
 from dynafield import config
+from dynafield.clerk.redis_client import get_redis_connection
+from dynafield.clerk.token_verifier import token_digest
+from dynafield.utils import json_tools
 
 logger = logging.getLogger(__name__)
 
+# Cached user blobs stay JSON: rediskit's client decodes replies as UTF-8 (decode_responses=True),
+# so a binary format such as msgpack would not survive the read path
+_pack = json_tools.dumps
+_unpack = json_tools.loads
+
+_TOKEN_KEY_PREFIX = b"clerk_token:"
+
+
+def _token_key(token: str) -> bytes:
+    # keyed on the token digest, not the ~1 KB token itself
+    return _TOKEN_KEY_PREFIX + token_digest(token)
+
+
+def _user_key(user_id: str) -> str:
+    return f"clerk_user:{user_id}"
+
+
 # JWKS client for token verification
 jwks_client = PyJWKClient(config.CLERK_JWKS_URL)
 
@@ -24,42 +42,71 @@ class ClerkTokenCache:
         """Get user from cache if token is valid and cached"""
         try:
             # Check if token is cached
-            redis_client = await get_async_redis_connection()
-            cache_key = f"clerk_token:{token}"
+            redis_client = await get_redis_connection()
+            cache_key = _token_key(token)
             cached_user = await redis_client.get(cache_key)
 
             if cached_user:
                 logger.debug("User data found in cache")
-                data = json.loads(cached_user)
-                return dict(data)
+                return _unpack(cached_user)  # type: ignore[no-any-return]
 
             return None
         except Exception as e:
             logger.error(f"Error reading from cache: {e}")
             return None
 
+    @staticmethod
+    async def get_cached_user_with_user_id(token: str, user_id: Optional[str]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Read the token- and user-ID-keyed entries in one pipelined round trip"""
+        try:
+            redis_connection = await get_redis_connection()
+            async with redis_connection.pipeline(transaction=False) as pipe:
+                pipe.get(_token_key(token))
+                if user_id:
+                    pipe.get(_user_key(user_id))
+                results = await pipe.execute()
+
+            cached_user = _unpack(results[0]) if results[0] else None
+            cached_user_by_id = _unpack(results[1]) if len(results) > 1 and results[1] else None
+            return cached_user, cached_user_by_id
+        except Exception as e:
+            logger.error(f"Error reading from cache: {e}")
+            return None, None
+
     async def cache_user(self, token: str, user_data: Dict[str, Any]) -> None:
         """Cache user data with token as key"""
         try:
-            redis_connection = await get_async_redis_connection()
-            cache_key = f"clerk_token:{token}"
-            await redis_connection.setex(cache_key, self.token_cache_ttl, json.dumps(user_data))
+            redis_connection = await get_redis_connection()
+            cache_key = _token_key(token)
+            await redis_connection.setex(cache_key, self.token_cache_ttl, _pack(user_data))
             logger.debug("User data cached successfully")
         except Exception as e:
             logger.error(f"Error caching user data: {e}")
 
+    async def cache_user_both(self, token: str, user_id: str, user_data: Dict[str, Any]) -> None:
+        """Cache user data by token and by user ID in one pipelined round trip"""
+        try:
+            blob = _pack(user_data)
+            redis_connection = await get_redis_connection()
+            async with redis_connection.pipeline(transaction=False) as pipe:
+                pipe.setex(_token_key(token), self.token_cache_ttl, blob)
+                pipe.setex(_user_key(user_id), self.user_cache_ttl, blob)
+                await pipe.execute()
+            logger.debug(f"User {user_id} cached successfully")
+        except Exception as e:
+            logger.error(f"Error caching user data: {e}")
+
     @staticmethod
     async def get_cached_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
         """Get user data by user ID (for tenant resolution)"""
         try:
-            redis_connection = await get_async_redis_connection()
-            cache_key = f"clerk_user:{user_id}"
+            redis_connection = await get_redis_connection()
+            cache_key = _user_key(user_id)
             cached_user = await redis_connection.get(cache_key)
 
             if cached_user:
                 logger.debug(f"User {user_id} found in cache")
-                data = json.loads(cached_user)
-                return dict(data)
+                return _unpack(cached_user)  # type: ignore[no-any-return]
 
             return None
         except Exception as e:
@@ -69,9 +116,9 @@ class ClerkTokenCache:
     async def cache_user_by_id(self, user_id: str, user_data: Dict[str, Any]) -> None:
         """Cache user data by user ID"""
         try:
-            redis_connection = await get_async_redis_connection()
-            cache_key = f"clerk_user:{user_id}"
-            await redis_connection.setex(cache_key, self.user_cache_ttl, json.dumps(user_data))
+            redis_connection = await get_redis_connection()
+            cache_key = _user_key(user_id)
+            await redis_connection.setex(cache_key, self.user_cache_ttl, _pack(user_data))
             logger.debug(f"User {user_id} cached successfully")
         except Exception as e:
             logger.error(f"Error caching user by ID: {e}")
@@ -80,9 +127,8 @@ class ClerkTokenCache:
     async def invalidate_user_cache(user_id: str) -> None:
         """Invalidate cache for a specific user"""
         try:
-            redis_connection = await get_async_redis_connection()
-            cache_key = f"clerk_user:{user_id}"
-            await redis_connection.delete(cache_key)
+            redis_connection = await get_redis_connection()
+            await redis_connection.delete(_user_key(user_id))
             logger.debug(f"Cache invalidated for user {user_id}")
         except Exception as e:
             logger.error(f"Error invalidating user cache: {e}")
@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import time
-from typing import Any
+from typing import Any, Dict, Optional
 
-from jwt import PyJWKClient
-from rediskit.redis.a_client import get_async_redis_connection
+import jwt
+from jwt import PyJWK, PyJWKClient, PyJWKClientError
 
 from .. import config
 
@@ -11,59 +12,80 @@ logger = logging.getLogger(__name__)
 
 
 class CachedJWKClient:
-    """JWKS client with Redis caching and automatic refresh"""
+    """JWKS client with an in-process key cache and stale-while-revalidate refresh"""
 
     def __init__(self) -> None:
         self.jwks_client = PyJWKClient(
             config.CLERK_JWKS_URL,
-            cache_keys=True,  # Enable built-in memory cache
             lifespan=3600,  # 1 hour cache
         )
-        self.redis_cache_ttl = 86400  # 24 hours in Redis
         self.last_refresh = 0.0
         self.refresh_interval = 3600  # 1 hour
+        self.refresh_margin = 300  # start revalidating 5 minutes before keys go stale
+        self.refresh_timeout = 10.0  # seconds a background refresh may take
+        self.unknown_kid_cooldown = 30  # min seconds between refreshes triggered by an unknown kid
+
+        # kid -> signing key, from the last successful fetch (monotonic time in last_refresh)
+        self._signing_keys: Dict[str, PyJWK] = {}
+        # the fetch in flight, shared by every caller that needs fresh keys
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
 
     async def get_signing_key(self, token: str) -> Any:
-        """Get signing key with Redis caching"""
+        """Get signing key, serving cached keys while a refresh runs in the background"""
         try:
-            # Try to get from Redis cache first
-            redis_connection = await get_async_redis_connection()
-            cache_key = "clerk_jwks"
-            cached_jwks = await redis_connection.get(cache_key)
-
-            if cached_jwks:
-                logger.debug("JWKS found in Redis cache")
-                # The PyJWKClient will use its internal cache if available
-                return self.jwks_client.get_signing_key_from_jwt(token)
-
-            # If not in Redis, use the client (which has its own cache)
-            # and cache the fact that we've fetched it
-            signing_key = self.jwks_client.get_signing_key_from_jwt(token)
-
-            # Cache the JWKS availability in Redis (we don't cache the actual keys,
-            # just that we've successfully fetched them)
-            await redis_connection.setex(cache_key, self.redis_cache_ttl, "available")
-
+            kid = jwt.get_unverified_header(token).get("kid")
+            if not isinstance(kid, str):
+                raise PyJWKClientError("Token header has no usable kid")
+
+            signing_key = self._signing_keys.get(kid)
+            age = time.monotonic() - self.last_refresh
+            if signing_key is not None:
+                if age > self.refresh_interval - self.refresh_margin:
+                    self._start_refresh()
+                return signing_key
+
+            # Unknown kid (first request or key rotation): this caller has to wait for the keys,
+            # but made-up kids must not turn every request into a JWKS fetch
+            if not self._signing_keys or age > self.unknown_kid_cooldown:
+                await self._refresh()
+            signing_key = self._signing_keys.get(kid)
+            if signing_key is None:
+                raise PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
             return signing_key
 
         except Exception as e:
             logger.error(f"Failed to get signing key: {e}")
             raise
 
+    def _start_refresh(self) -> "asyncio.Task[None]":
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._fetch_signing_keys())
+        return self._refresh_task
+
+    async def _refresh(self) -> None:
+        # shield: a caller timing out must not cancel the fetch other callers are waiting on
+        await asyncio.shield(self._start_refresh())
+
+    async def _fetch_signing_keys(self) -> None:
+        try:
+            # PyJWKClient does blocking HTTP, keep it off the event loop
+            signing_keys = await asyncio.wait_for(asyncio.to_thread(self.jwks_client.get_signing_keys, True), self.refresh_timeout)
+        except Exception as e:
+            if not self._signing_keys:
+                raise
+            # keep serving the keys we have; the next stale read retries
+            logger.warning(f"Background JWKS refresh failed, serving cached keys: {e}")
+            return
+
+        self._signing_keys = {key.key_id: key for key in signing_keys if key.key_id}
+        self.last_refresh = time.monotonic()
+        logger.debug(f"JWKS refreshed ({len(self._signing_keys)} signing keys)")
+
     async def refresh_jwks_if_needed(self) -> None:
         """Force refresh JWKS if cache is stale"""
-        current_time = time.time()
-        if current_time - self.last_refresh > self.refresh_interval:
+        if time.monotonic() - self.last_refresh > self.refresh_interval:
             try:
-                redis_connection = await get_async_redis_connection()
-                # Clear the internal cache to force refresh
-                if hasattr(self.jwks_client, "_cache"):
-                    self.jwks_client._cache.clear()
-
-                # Also clear Redis cache marker
-                await redis_connection.delete("clerk_jwks")
-
-                self.last_refresh = current_time
+                await self._refresh()
                 logger.info("JWKS cache refreshed")
 
             except Exception as e:
@@ -1,23 +1,57 @@
 import asyncio
 import logging
+from typing import Optional
 
 from dynafield.clerk.jwks_cache import cached_jwks_client
 
 logger = logging.getLogger(__name__)
 
+JWKS_REFRESH_INTERVAL = 3600.0  # 1 hour
+JWKS_REFRESH_RETRY_DELAY = 300.0  # 5 minutes after a failed refresh
 
-async def refresh_jwks_periodically() -> None:
+# Held here so the task isn't garbage-collected mid-refresh, and so shutdown can stop it
+_refresh_task: Optional["asyncio.Task[None]"] = None
+_stop: Optional[asyncio.Event] = None
+
+
+async def refresh_jwks_periodically(stop: Optional[asyncio.Event] = None) -> None:
     """Background task to refresh JWKS periodically"""
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    # Deadlines advance by a fixed interval, so time spent refreshing doesn't push later refreshes back
+    next_deadline = loop.time() + JWKS_REFRESH_INTERVAL
     while True:
         try:
-            await asyncio.sleep(3600)  # Wait 1 hour
+            await asyncio.wait_for(stop.wait(), timeout=max(0.0, next_deadline - loop.time()))
+            return  # stop was set
+        except asyncio.TimeoutError:
+            pass
+
+        try:
             await cached_jwks_client.refresh_jwks_if_needed()
+            next_deadline += JWKS_REFRESH_INTERVAL
         except Exception as e:
             logger.error(f"Background JWKS refresh failed: {e}")
-            await asyncio.sleep(300)  # Wait 5 minutes on error
+            next_deadline = loop.time() + JWKS_REFRESH_RETRY_DELAY
 
 
 async def start_jwks_refresh_task() -> None:
     """Start the JWKS refresh task"""
-    asyncio.create_task(refresh_jwks_periodically())
+    global _refresh_task, _stop
+    if _refresh_task is not None and not _refresh_task.done():
+        return
+    _stop = asyncio.Event()
+    _refresh_task = asyncio.create_task(refresh_jwks_periodically(_stop))
     logger.info("JWKS refresh task started")
+
+
+async def stop_jwks_refresh_task() -> None:
+    """Stop the JWKS refresh task, waiting for an in-flight refresh to finish"""
+    global _refresh_task, _stop
+    if _stop is not None:
+        _stop.set()
+    if _refresh_task is not None:
+        await _refresh_task
+    _refresh_task = None
+    _stop = None
+    logger.info("JWKS refresh task stopped")
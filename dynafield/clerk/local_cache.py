@@ -0,0 +1,59 @@
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LocalTTLCache(Generic[K, V]):
+    """Bounded process-local TTL map used in front of Redis on the auth path"""
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        # key -> (monotonic deadline, value)
+        self._entries: Dict[K, Tuple[float, V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        deadline, value = entry
+        if time.monotonic() >= deadline:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: K, value: V, expires_at: Any = None) -> None:
+        """Store ``value`` for ``ttl`` seconds, never past ``expires_at`` (epoch seconds, e.g. a JWT exp claim)"""
+        ttl = self.ttl
+        if isinstance(expires_at, (int, float)):
+            ttl = min(ttl, expires_at - time.time())
+        if ttl <= 0:
+            return
+
+        now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= self.max_size:
+            # Evict from the front (oldest inserts first) instead of scanning the whole map: the
+            # oldest entry makes room, and any expired entries right behind it go with it
+            entries = self._entries
+            del entries[next(iter(entries))]
+            while entries:
+                oldest = next(iter(entries))
+                if entries[oldest][0] > now:
+                    break
+                del entries[oldest]
+        self._entries[key] = (now + ttl, value)
+
+    def discard(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[V], bool]) -> None:
+        for key in [k for k, (_, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
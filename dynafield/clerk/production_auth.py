@@ -1,19 +1,40 @@
+import base64
 import logging
 from typing import Any, Dict, Optional
 
 from fastapi import Request
 
 from dynafield.clerk.clerk_cache import clerk_cache
-from dynafield.clerk.token_verifier import token_verifier
+from dynafield.clerk.local_cache import LocalTTLCache
+from dynafield.clerk.token_verifier import token_digest, token_verifier
+from dynafield.utils import json_tools
 
 logger = logging.getLogger(__name__)
 
+# Process-local layer in front of Redis; kept short so invalidations on other workers catch up quickly
+LOCAL_USER_CACHE_TTL = 60.0
+LOCAL_USER_CACHE_SIZE = 10_000
+
+# token digest -> user data
+_local_user_cache: LocalTTLCache[bytes, Dict[str, Any]] = LocalTTLCache(LOCAL_USER_CACHE_TTL, LOCAL_USER_CACHE_SIZE)
+
 
 class MockRequest:
     def __init__(self, token: str) -> None:
         self.headers = {"authorization": f"Bearer {token}"}
 
 
+def _peek_sub(token: str) -> Optional[str]:
+    """Read the ``sub`` claim without verifying the token; only use it as a cache hint"""
+    try:
+        payload_segment = token.split(".", 2)[1]
+        payload = json_tools.loads(base64.urlsafe_b64decode(payload_segment + "=" * (-len(payload_segment) % 4)))
+    except (IndexError, ValueError, TypeError):
+        return None
+    sub = payload.get("sub") if isinstance(payload, dict) else None
+    return sub if isinstance(sub, str) else None
+
+
 async def get_current_user_production(request: Request | MockRequest) -> Optional[Dict[str, Any]]:
     """Production-grade user resolution with optimal caching"""
     auth_header = request.headers.get("authorization", "")
@@ -27,12 +48,21 @@ async def get_current_user_production(request: Request | MockRequest) -> Optiona
     if len(token) < 50:  # Basic JWT length check
         return None
 
+    token_hash = token_digest(token)
+    local_user = _local_user_cache.get(token_hash)
+    if local_user is not None:
+        # callers get their own dict, as they would from a Redis read
+        return dict(local_user)
+
     try:
-        # Layer 1: Check if user data is cached by token
-        cached_user = await clerk_cache.get_cached_user(token)
+        # Layer 1: Check if user data is cached by token, prefetching the entry for the
+        # (still unverified) user ID in the same round trip
+        peeked_user_id = _peek_sub(token)
+        cached_user, prefetched_user = await clerk_cache.get_cached_user_with_user_id(token, peeked_user_id)
         if cached_user:
             logger.debug("User data found in token cache")
-            return cached_user
+            _local_user_cache.set(token_hash, cached_user, cached_user.get("token_expires_at"))
+            return dict(cached_user)
 
         # Layer 2: Verify token with cached verification
         payload = await token_verifier.verify_and_decode_token(token)
@@ -45,13 +75,18 @@ async def get_current_user_production(request: Request | MockRequest) -> Optiona
         if not user_id:
             return None
 
-        # Layer 3: Check if user data is cached by user ID
-        cached_user_by_id = await clerk_cache.get_cached_user_by_id(user_id)
+        # Layer 3: Check if user data is cached by user ID; the prefetched entry is only
+        # trusted once the verified sub matches the one it was looked up with
+        if user_id == peeked_user_id:
+            cached_user_by_id = prefetched_user
+        else:
+            cached_user_by_id = await clerk_cache.get_cached_user_by_id(user_id)
         if cached_user_by_id:
             # Also cache by token for future requests
             await clerk_cache.cache_user(token, cached_user_by_id)
+            _local_user_cache.set(token_hash, cached_user_by_id, payload.get("exp"))
             logger.debug("User data found in user ID cache")
-            return cached_user_by_id
+            return dict(cached_user_by_id)
 
         user_data = {
             "clerk_id": user_id,
@@ -64,10 +99,10 @@ async def get_current_user_production(request: Request | MockRequest) -> Optiona
         }
 
         # Cache in both token and user ID caches
-        await clerk_cache.cache_user(token, user_data)
-        await clerk_cache.cache_user_by_id(user_id, user_data)
+        await clerk_cache.cache_user_both(token, user_id, user_data)
+        _local_user_cache.set(token_hash, user_data, payload.get("exp"))
 
-        return user_data
+        return dict(user_data)
 
     except Exception as e:
         logger.error(f"Authentication failed: {e}")
@@ -76,5 +111,6 @@ async def get_current_user_production(request: Request | MockRequest) -> Optiona
 
 async def invalidate_user_cache(user_id: str) -> None:
     """Invalidate all caches for a user"""
+    _local_user_cache.discard_where(lambda user_data: user_data.get("clerk_id") == user_id)
     await clerk_cache.invalidate_user_cache(user_id)
     logger.info(f"Cache invalidated for user {user_id}")
@@ -0,0 +1,23 @@
+import asyncio
+import weakref
+from typing import Any
+
+from rediskit.redis.a_client import get_async_redis_connection
+
+# rediskit's async client per event loop, so every cache op reuses one client and its connection pool
+_connections: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+async def get_redis_connection() -> Any:
+    """Shared async Redis client for the clerk caches"""
+    loop = asyncio.get_running_loop()
+    connection = _connections.get(loop)
+    if connection is None:
+        connection = await get_async_redis_connection()
+        _connections[loop] = connection
+    return connection
+
+
+def reset_redis_connection() -> None:
+    """Forget the shared clients, e.g. after rediskit was re-initialized"""
+    _connections.clear()
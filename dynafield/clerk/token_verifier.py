@@ -1,13 +1,29 @@
+import hashlib
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import jwt
-from rediskit.redis.a_client import get_async_redis_connection
 
 from dynafield.clerk.jwks_cache import cached_jwks_client
+from dynafield.clerk.local_cache import LocalTTLCache
+from dynafield.clerk.redis_client import get_redis_connection
 
 logger = logging.getLogger(__name__)
 
+VERIFIED_CACHE_SIZE = 10_000
+REJECTED_CACHE_SIZE = 10_000
+
+# Values verify_and_decode_token leaves under token_verify:<hash> for rejected tokens
+_REJECTED_MARKERS = frozenset({b"expired", b"invalid", "expired", "invalid"})
+
+
+@lru_cache(maxsize=4096)
+def token_digest(token: str) -> bytes:
+    """16-byte sha256 prefix of the token, used in place of the token in cache keys"""
+    # memoized since a session keeps presenting the same token
+    return hashlib.sha256(token.encode()).digest()[:16]
+
 
 class TokenVerifier:
     """Production-grade token verification with multiple cache layers"""
@@ -15,31 +31,45 @@ class TokenVerifier:
     def __init__(self) -> None:
         self.jwks_client = cached_jwks_client
         self.token_cache_ttl = 300  # 5 minutes
+        self.rejected_cache_ttl = 60
+        # Verified payloads stay in-process: with the signing key memory-cached, decoding is cheaper than a Redis round trip
+        self._verified: LocalTTLCache[bytes, Dict[str, Any]] = LocalTTLCache(self.token_cache_ttl, VERIFIED_CACHE_SIZE)
+        # Local copy of the Redis rejection markers, so a token replayed against this process skips the GET
+        self._rejected: LocalTTLCache[bytes, str] = LocalTTLCache(self.rejected_cache_ttl, REJECTED_CACHE_SIZE)
 
     async def verify_and_decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify JWT token with multiple cache layers"""
-        # Cache key for token verification result
         token_hash = self._get_token_hash(token)
-        cache_key = f"token_verify:{token_hash}"
-        redis_connection = await get_async_redis_connection()
 
-        try:
-            # Layer 1: Check if token verification is cached
+        # Layer 1: Check if this process already verified the token
+        payload = self._verified.get(token_hash)
+        if payload is not None:
+            # callers get their own dict, so mutating it cannot poison the cached entry
+            return dict(payload)
+        if self._rejected.get(token_hash) is not None:
+            return None
 
-            cached_payload = await redis_connection.get(cache_key)
-            if cached_payload:
-                logger.debug("Token verification result found in cache")
-                return self._safe_json_loads(cached_payload)
+        # Cache key for rejected tokens, shared across processes
+        cache_key = b"token_verify:" + token_hash
+        redis_connection = await get_redis_connection()
 
-            # Layer 2: Verify token with cached JWKS
+        try:
+            # Layer 2: Check if the token was already rejected
+            rejection = await redis_connection.get(cache_key)
+            if rejection in _REJECTED_MARKERS:
+                logger.debug("Token rejection found in cache")
+                self._rejected.set(token_hash, "rejected")
+                return None
+
+            # Layer 3: Verify token with cached JWKS
             signing_key = await self.jwks_client.get_signing_key(token)
 
             payload = jwt.decode(
                 token, signing_key.key, algorithms=["RS256"], options={"verify_aud": False, "verify_exp": True, "verify_iss": True, "verify_signature": True}
             )
 
-            # Cache the verification result
-            await redis_connection.setex(cache_key, self.token_cache_ttl, self._safe_json_dumps(payload))
+            # Cache the verification result, never past the token's own expiry
+            self._verified.set(token_hash, payload, payload.get("exp"))
 
             logger.debug("Token verified and cached")
             return dict(payload)
@@ -47,41 +77,23 @@ class TokenVerifier:
         except jwt.ExpiredSignatureError:
             logger.warning("Token expired")
             # Cache expired tokens briefly to avoid repeated processing
-            await redis_connection.setex(cache_key, 60, "expired")
+            self._rejected.set(token_hash, "expired")
+            await redis_connection.setex(cache_key, self.rejected_cache_ttl, "expired")
             return None
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token: {e}")
             # Cache invalid tokens briefly
-            await redis_connection.setex(cache_key, 60, "invalid")
+            self._rejected.set(token_hash, "invalid")
+            await redis_connection.setex(cache_key, self.rejected_cache_ttl, "invalid")
             return None
         except Exception as e:
             logger.error(f"Token verification failed: {e}")
             return None
 
     @staticmethod
-    def _get_token_hash(token: str) -> str:
+    def _get_token_hash(token: str) -> bytes:
         """Create a simple hash of the token for caching"""
-        import hashlib
-
-        return hashlib.md5(token.encode()).hexdigest()
-
-    @staticmethod
-    def _safe_json_dumps(data: Dict[str, Any]) -> str:
-        """Safely serialize data to JSON"""
-        import json
-
-        return json.dumps(data, default=str)
-
-    @staticmethod
-    def _safe_json_loads(data: str) -> Optional[Dict[str, Any]]:
-        """Safely deserialize JSON data"""
-        import json
-
-        try:
-            result = json.loads(data)
-            return dict(result)
-        except (json.JSONDecodeError, TypeError):
-            return None
+        return token_digest(token)
 
 
 # Global instance
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 from dynafield import config
@@ -22,6 +23,9 @@ def get_db_credentials(role: DBUserRole) -> DBUserCredentials:
     return creds[role]
 
 
+# Output only depends on (role, db, mode) once the database settings are in config, so repeat tenant lookups
+# are a cache hit; config is still read lazily on the first call rather than at import
+@lru_cache(maxsize=128)
 def conn_string(*, role: DBUserRole = "crud", db: str = config.DEFAULT_TENANT_DATABASE_ID, mode: DBConnMode = "sync") -> str:
     host = config.DATABASE_HOST
     port = config.DATABASE_PORT
@@ -36,6 +36,36 @@ class MigrationManager:
 
         log.debug(f"MigrationManager initialized with DB URL: {db_url} and schema: {schema}")
 
+        # Created on first use and shared by every step of a migration run, see close()
+        self._engine: Optional[Engine] = None
+        self._admin_engine: Optional[Engine] = None
+
+    def _get_engine(self) -> Engine:
+        if self._engine is None:
+            self._engine = sqlalchemy.create_engine(
+                self.db_url,
+                isolation_level="AUTOCOMMIT",
+                connect_args={"connect_timeout": 10, "application_name": "migration_manager"},
+                pool_recycle=300,
+                pool_pre_ping=True,
+            )
+        return self._engine
+
+    def _get_admin_engine(self) -> Engine:
+        """Engine on the server's postgres database, for creating the target database"""
+        if self._admin_engine is None:
+            admin_url = self.db_url.rsplit("/", 1)[0] + "/postgres"
+            self._admin_engine = sqlalchemy.create_engine(admin_url, isolation_level="AUTOCOMMIT")
+        return self._admin_engine
+
+    def close(self) -> None:
+        """Dispose the cached engines and their pooled connections"""
+        for engine in (self._engine, self._admin_engine):
+            if engine is not None:
+                engine.dispose()
+        self._engine = None
+        self._admin_engine = None
+
     def _get_db_name(self) -> str:
         """Extract database name from URL"""
         try:
@@ -49,10 +79,7 @@ class MigrationManager:
             db_name = self._get_db_name()
 
             # Connect to postgres database to create our target DB
-            admin_url = self.db_url.rsplit("/", 1)[0] + "/postgres"
-            engine = sqlalchemy.create_engine(admin_url, isolation_level="AUTOCOMMIT")
-
-            with engine.connect() as conn:
+            with self._get_admin_engine().connect() as conn:
                 result = conn.execute(text("SELECT 1 FROM pg_database WHERE datname = :db_name"), {"db_name": db_name})
 
                 if not result.fetchone():
@@ -66,8 +93,7 @@ class MigrationManager:
     def ensure_schema(self) -> None:
         """Create schema if it doesn't exist"""
         try:
-            engine = sqlalchemy.create_engine(self.db_url)
-            with engine.begin() as conn:
+            with self._get_engine().begin() as conn:
                 conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{self.schema}"'))
                 log.debug(f"Schema '{self.schema}' ready")
         except Exception as e:
@@ -76,30 +102,20 @@ class MigrationManager:
     def run_migrations(self) -> None:
         """Run all migrations safely"""
         log.info("Starting database migrations...")
-        engine: Optional[Engine] = None
         try:
-            engine = sqlalchemy.create_engine(
-                self.db_url,
-                isolation_level="AUTOCOMMIT",
-                connect_args={"connect_timeout": 10, "application_name": "migration_manager"},
-                pool_recycle=300,
-                pool_pre_ping=True,
-            )
-            with engine.connect() as _conn:
-                log.debug("✓ Connected to PostgreSQL!")
-            # Explicitly dispose the engine
-            if engine:
-                engine.dispose()
-            log.debug("✓ Connection closed properly")
-        except Exception as e:
-            log.error(f"✗ Connection to database failed: {e}")
-            if engine:
-                engine.dispose()
-            raise
-
-        # Ensure database and schema exist
-        self.ensure_database()
-        self.ensure_schema()
+            try:
+                with self._get_engine().connect() as _conn:
+                    log.debug("✓ Connected to PostgreSQL!")
+            except Exception as e:
+                log.error(f"✗ Connection to database failed: {e}")
+                raise
+
+            # Ensure database and schema exist
+            self.ensure_database()
+            self.ensure_schema()
+        finally:
+            # Alembic opens its own connection from the config URL, so the setup engines are done here
+            self.close()
 
         # Apply migrations
         try:
@@ -112,8 +128,7 @@ class MigrationManager:
     def is_schema_initialized(self) -> bool:
         """Check if migrations have been run"""
         try:
-            engine = sqlalchemy.create_engine(self.db_url)
-            with engine.connect() as conn:
+            with self._get_engine().connect() as conn:
                 # Check if alembic_version table exists
                 result = conn.execute(
                     text("""
@@ -20,20 +20,34 @@ _engines: dict[str, AsyncEngine] = {}
 _session_makers: dict[str, async_sessionmaker[AsyncSession]] = {}
 _engine_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
+_SET_TENANT_SQL = text("SELECT set_config('app.tenant_id', :tenant_id, true)")
+
+
+# Allow alphanumeric, underscores, and hyphens (common in UUIDs and slugs); fullmatch so a trailing newline can't slip through
+_IDENTIFIER_RE = re.compile(r"[a-zA-Z0-9_\-]+")
+# Tenant/database ids repeat on every session, so remember the ones that already passed
+_validated_identifiers: set[str] = set()
+_VALIDATED_IDENTIFIERS_MAX = 4096
+
 
 def _validate_identifier(identifier: str, identifier_type: str) -> str:
     """Validate and sanitize identifiers for use in SQL"""
+    if identifier in _validated_identifiers:
+        return identifier
+
     if not identifier:
         raise ValueError(f"{identifier_type} cannot be empty")
 
-    # Allow alphanumeric, underscores, and hyphens (common in UUIDs and slugs)
-    if not re.match(r"^[a-zA-Z0-9_\-]+$", identifier):
+    if not _IDENTIFIER_RE.fullmatch(identifier):
         raise ValueError(f"Invalid {identifier_type}: {identifier}. Only alphanumeric, underscore, and hyphen characters are allowed.")
 
     # Additional length checks if needed
     if len(identifier) > 128:
         raise ValueError(f"{identifier_type} too long: {identifier}")
 
+    if len(_validated_identifiers) >= _VALIDATED_IDENTIFIERS_MAX:
+        _validated_identifiers.clear()
+    _validated_identifiers.add(identifier)
     return identifier
 
 
@@ -76,10 +90,11 @@ async def a_create_session(tenant_db_id: str, tenant_id: str) -> AsyncSession:
 
 
 async def _set_rls_context(session: AsyncSession, tenant_id: str, user_id: str | None = None) -> None:
-    """Set RLS context using properly formatted SQL for SET commands"""
+    """Set RLS context for the current transaction (set_config with is_local=true is SET LOCAL)"""
     try:
         sanitized_tenant_id = _validate_identifier(tenant_id, "tenant_id")
-        await session.execute(text(f"SET LOCAL app.tenant_id = '{sanitized_tenant_id}'"))
+        # Bound parameter keeps the SQL text identical for every tenant
+        await session.execute(_SET_TENANT_SQL, {"tenant_id": sanitized_tenant_id})
         log.debug("Set RLS context", extra={"tenant_id": tenant_id})
 
     except Exception as e:
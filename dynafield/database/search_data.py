@@ -1,3 +1,5 @@
+import itertools
+import re
 from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from sqlalchemy import select, text
@@ -11,6 +13,8 @@ log = get_logger(__name__)
 
 T = TypeVar("T")
 
+_PLACEHOLDER_RE = re.compile(r"%s")
+
 
 async def search_models(
     session: AsyncSession,
@@ -45,46 +49,55 @@ async def search_models(
                         log.debug("Empty IN list - returning empty results")
                         return [], 0
                     elif len(in_value) == 1:
-                        formatted_where = where_clause.replace(" IN %s", " = :param_0")
-                        execution_params["param_0"] = in_value[0]
+                        formatted_where = where_clause.replace(" IN %s", " = :filter_param_0")
+                        execution_params["filter_param_0"] = in_value[0]
                         log.debug(f"Converted single-value IN to equality: {formatted_where}")
                     else:
-                        placeholders = ", ".join([f":param_{i}" for i in range(len(in_value))])
+                        placeholders = ", ".join([f":filter_param_{i}" for i in range(len(in_value))])
                         formatted_where = where_clause.replace(" IN %s", f" IN ({placeholders})")
                         for i, value in enumerate(in_value):
-                            execution_params[f"param_{i}"] = value
+                            execution_params[f"filter_param_{i}"] = value
                         log.debug(f"Multi-value IN clause: {formatted_where}")
                 else:
-                    formatted_where = where_clause.replace(" IN %s", " = :param_0")
-                    execution_params["param_0"] = in_value
+                    formatted_where = where_clause.replace(" IN %s", " = :filter_param_0")
+                    execution_params["filter_param_0"] = in_value
                     log.debug(f"Converted single-value IN to equality: {formatted_where}")
 
             else:
-                formatted_where = where_clause
-                for i, param in enumerate(params):
-                    formatted_where = formatted_where.replace("%s", f":param_{i}", 1)
-                    execution_params[f"param_{i}"] = param
+                # Number the placeholders in one scan instead of a str.replace pass per parameter
+                placeholder_index = itertools.count()
+                formatted_where = _PLACEHOLDER_RE.sub(lambda _: f":filter_param_{next(placeholder_index)}", where_clause, count=len(params))
+                execution_params.update({f"filter_param_{i}": param for i, param in enumerate(params)})
 
             stmt = stmt.where(text(formatted_where))
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await session.execute(count_stmt, execution_params)
-    count = count_result.scalar() or 0
-
     if count_only:
-        return [], count
+        return [], await _count(session, stmt, execution_params)
 
+    # Total comes back on every row through a window function, so the page and its count take one round trip
+    page_stmt = stmt.add_columns(func.count().over().label("total_count"))
     if limit is not None:
-        stmt = stmt.limit(limit)
+        page_stmt = page_stmt.limit(limit)
     if offset is not None:
-        stmt = stmt.offset(offset)
+        page_stmt = page_stmt.offset(offset)
 
     if get_first:
-        stmt = stmt.limit(1)
+        page_stmt = page_stmt.limit(1)
+
+    result = await session.execute(page_stmt, execution_params)
+    rows = result.all()
+    if not rows:
+        # An offset past the end (or a zero limit) yields no row to read the total from
+        return [], await _count(session, stmt, execution_params) if offset or limit == 0 else 0
 
-    result = await session.scalars(stmt, execution_params)
-    models = list(result.all())
-    return models, count
+    models = [row[0] for row in rows]
+    return models, rows[0].total_count
+
+
+async def _count(session: AsyncSession, stmt: Select[Any], execution_params: Dict[str, Any]) -> int:
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    count_result = await session.execute(count_stmt, execution_params)
+    return int(count_result.scalar() or 0)
 
 
 def validate_parameters(where_clause: str, params: List[Any]) -> None:
@@ -1,6 +1,9 @@
-from typing import List, Optional, Tuple, Type
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, Type
 
+from pydantic import BaseModel
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlmodel import SQLModel
 
@@ -12,7 +15,7 @@ tracer = get_tracer(__name__)
 
 
 async def get_data_to_add_and_update[T: SQLModel](
-    session: AsyncSession, tenant_id: str, data: List[T], primary_key: str = "id"
+    session: AsyncSession, tenant_id: str, data: List[T], primary_key: str = "id", return_existing: bool = True
 ) -> Tuple[List[T], List[T], List[T]]:
     """Get lists of items to add, update, and existing items.
 
@@ -21,6 +24,8 @@ async def get_data_to_add_and_update[T: SQLModel](
         tenant_id: Tenant identifier
         data: List of items to process
         primary_key: Name of the primary key attribute
+        return_existing: Load the existing rows; when False only their primary keys are
+            fetched and existing_items is returned empty
 
     Returns:
         Tuple of (items_to_add, items_to_update, existing_items)
@@ -32,17 +37,26 @@ async def get_data_to_add_and_update[T: SQLModel](
     with tracer.start_as_current_span(f"Add{model_name}"):
         log.debug(f"Adding or updating {model_name} on tenant {tenant_id}.")
 
-        data_ids = [getattr(doc, primary_key) for doc in data]
-        stmt = select(data[0].__class__).where(getattr(data[0].__class__, primary_key).in_(data_ids))
+        model = data[0].__class__
+        get_pk = attrgetter(primary_key)
+        data_ids = list(map(get_pk, data))
+        pk_column = getattr(model, primary_key)
 
-        # Execute query and extract model instances from rows
-        execution = await session.execute(stmt)
-        existing_data = [row[0] for row in execution.all()]
-
-        existing_ids = {getattr(doc, primary_key) for doc in existing_data}
+        existing_data: List[T] = []
+        if return_existing:
+            # Execute query; scalars() yields the model instances without row tuples
+            existing_data = list((await session.execute(select(model).where(pk_column.in_(data_ids)))).scalars().all())
+            existing_ids = frozenset(map(get_pk, existing_data))
+        else:
+            # Only the keys are needed: stream them (an index-only scan) instead of loading whole rows
+            pk_result = await session.stream_scalars(select(pk_column).where(pk_column.in_(data_ids)))
+            existing_ids = frozenset([pk async for pk in pk_result])
 
-        to_add = [doc for doc in data if getattr(doc, primary_key) not in existing_ids]
-        to_update = [doc for doc in data if getattr(doc, primary_key) in existing_ids]
+        # Partition in one pass over data
+        to_add: List[T] = []
+        to_update: List[T] = []
+        for doc in data:
+            (to_update if get_pk(doc) in existing_ids else to_add).append(doc)
 
         return to_add, to_update, existing_data
 
@@ -71,16 +85,69 @@ async def update_table_data[T: SQLModel](
     if not table_data:
         return
 
-    update_dicts = []
+    # Rows for a repeated primary key are merged first (later values win), so lining up the
+    # remaining one-row-per-key updates below cannot reorder writes to the same row
+    merged: Dict[Any, Dict[str, Any]] = {}
     for item in table_data:
         if isinstance(item, SQLModel):
-            data = item.model_dump(exclude_unset=True)
+            # The explicitly set fields, read straight from the instance instead of a model_dump walk
+            values = item.__dict__
+            data = {key: values[key] for key in item.__pydantic_fields_set__}
+            if any(isinstance(value, (BaseModel, list, tuple, dict)) for value in data.values()):
+                # nested models (possibly inside lists/dicts, e.g. JSON columns) still need model_dump to serialize them
+                data = item.model_dump(exclude_unset=True)
         else:
             data = dict(item)
 
         if primary_key not in data:
             raise ValueError(f"Primary key '{primary_key}' missing in update data: {data}")
-        update_dicts.append(data)
+        pk_value = data[primary_key]
+        if pk_value in merged:
+            merged[pk_value].update(data)
+        else:
+            merged[pk_value] = data
 
+    # ORM bulk UPDATE sends each run of consecutive rows with the same key set as one executemany
+    # (pipelined by asyncpg), and exclude_unset yields mixed key sets, so equal shapes are lined up
+    update_groups: Dict[frozenset[str], List[Dict[str, Any]]] = {}
+    for data in merged.values():
+        update_groups.setdefault(frozenset(data), []).append(data)
+
+    update_dicts = [data for group in update_groups.values() for data in group]
     stmt = update(table)
     await session.execute(stmt, update_dicts)
+
+
+async def upsert_table_data[T: SQLModel](
+    session: AsyncSession,
+    table: Type[T],
+    table_data: Optional[List[T]] = None,
+    primary_key: str = "id",
+) -> None:
+    """
+    Inserts or overwrites rows with INSERT ... ON CONFLICT DO UPDATE, without a prior SELECT.
+
+    Rows are written in full: unset fields of an existing row are reset to the model defaults.
+    When a primary key repeats, only its last row is written, since PostgreSQL rejects an
+    ON CONFLICT DO UPDATE that would touch the same row twice.
+
+    Args:
+        session: Database session
+        table: SQLModel table class
+        table_data: List of rows to insert or update
+        primary_key: Name of the primary key column (the conflict target)
+    """
+    if not table_data:
+        return
+
+    with tracer.start_as_current_span(f"Upsert{table.__name__}"):
+        # last row per primary key wins
+        rows = list({row[primary_key]: row for row in (item.model_dump() for item in table_data)}.values())
+
+        stmt = pg_insert(table)
+        columns = table.__table__.columns  # type: ignore[attr-defined]
+        update_columns = {column.name: stmt.excluded[column.name] for column in columns if column.name != primary_key and column.name in rows[0]}
+        stmt = stmt.on_conflict_do_update(index_elements=[primary_key], set_=update_columns)
+
+        # executemany form, so SQLAlchemy batches the rows into multi-VALUES statements under the bind limit
+        await session.execute(stmt, rows)
@@ -9,19 +9,27 @@ def exp_col(column: str) -> "ColumnFilterBuilder":
     return ColumnFilterBuilder(column)
 
 
-def exp_and_(*conditions: FilterExpression) -> LogicalFilter:
+def exp_and_(*conditions: FilterExpression) -> FilterExpression:
     """Create AND filter"""
-    return LogicalFilter(operator=LogicalOperator.AND, conditions=List(conditions))
+    if len(conditions) == 1:
+        # AND of a single condition is the condition itself
+        return conditions[0]
+    return LogicalFilter(operator=LogicalOperator.AND, conditions=list(conditions))
 
 
-def exp_or_(*conditions: FilterExpression) -> LogicalFilter:
+def exp_or_(*conditions: FilterExpression) -> FilterExpression:
     """Create OR filter"""
-    return LogicalFilter(operator=LogicalOperator.OR, conditions=List(conditions))
+    if len(conditions) == 1:
+        # OR of a single condition is the condition itself
+        return conditions[0]
+    return LogicalFilter(operator=LogicalOperator.OR, conditions=list(conditions))
 
 
 class ColumnFilterBuilder:
     """Fluid interface for building column filters"""
 
+    __slots__ = ("column", "json_path")
+
     def __init__(self, column: str):
         self.column = column
         self.json_path: Optional[str] = None
@@ -1,15 +1,25 @@
 # polars_filter_builder.py
 from datetime import date, datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
 import polars as pl
 
-from dynafield.expressions.types import ColumnFilter, FilterOperator, LogicalFilter, LogicalOperator
+from dynafield.expressions.types import ColumnFilter, FilterExpression, FilterOperator, LogicalFilter, LogicalOperator
 
 
 class PolarsFilterBuilder:
     """Converts filter expressions to Polars expressions"""
 
+    def build(self, expression: FilterExpression) -> pl.Expr:
+        """Build a Polars expression from any filter expression"""
+        if isinstance(expression, ColumnFilter):
+            return self.build_column_filter(expression)
+        elif isinstance(expression, LogicalFilter):
+            return self.build_logical_filter(expression)
+        else:
+            raise ValueError(f"Unsupported expression type: {type(expression)}")
+
     def build_column_filter(self, filter: ColumnFilter) -> pl.Expr:
         """Build Polars expression for a single column filter"""
         if filter.json_path:
@@ -19,7 +29,7 @@ class PolarsFilterBuilder:
             col_ref = pl.col(filter.column)
 
         # Handle list operations
-        if filter.operator in [FilterOperator.ANY_IN, FilterOperator.LIST_OVERLAP]:
+        if filter.operator in _ANY_LIST_OPERATORS:
             return self._build_list_operation(col_ref, filter.value, "any")
         elif filter.operator == FilterOperator.ALL_IN:
             return self._build_list_operation(col_ref, filter.value, "all")
@@ -32,33 +42,17 @@ class PolarsFilterBuilder:
 
     def build_logical_filter(self, filter: LogicalFilter) -> pl.Expr:
         """Build Polars expression for logical AND/OR filters"""
-        expressions = [condition.to_polars() for condition in filter.conditions]
+        expressions = [self.build(condition) for condition in filter.conditions]
 
+        # One horizontal node instead of a left-deep chain of N-1 binary & / | expressions
         if filter.operator == LogicalOperator.AND:
-            # Combine all expressions with AND
-            result = expressions[0]
-            for expr in expressions[1:]:
-                result = result & expr
-            return result
+            return pl.all_horizontal(expressions)
         else:  # OR
-            result = expressions[0]
-            for expr in expressions[1:]:
-                result = result | expr
-            return result
+            return pl.any_horizontal(expressions)
 
     def _build_json_col_reference(self, filter: ColumnFilter) -> pl.Expr:
         """Build Polars reference for JSON columns"""
-        if not filter.json_path:
-            return pl.col(filter.column)
-
-        # This assumes your JSON columns are properly structured as structs
-        path_parts = filter.json_path.split(".")
-        col_ref = pl.col(filter.column)
-
-        for part in path_parts:
-            col_ref = col_ref.struct.field(part)
-
-        return col_ref
+        return _json_col_reference(filter.column, filter.json_path)
 
     def _build_list_operation(self, col_ref: pl.Expr, value: Any, operation: str) -> pl.Expr:
         """Build list operations with proper type handling"""
@@ -79,12 +73,16 @@ class PolarsFilterBuilder:
             raise ValueError("Cannot perform LIST_CONTAINS with None value")
 
         processed_value = self._process_value_for_polars(value)
-        return pl.lit(processed_value).list.eval(pl.element().is_in(col_ref)).list.all()
+        if not processed_value:
+            return pl.lit(True)
+        # One native list.contains per wanted value; an eval over the literal can't reference the column
+        return pl.all_horizontal([col_ref.list.contains(item) for item in processed_value])
 
     def _process_value_for_polars(self, value: Any) -> Any:
         """Convert value to Polars-compatible type"""
-        if value is None:
-            return None
+        convert = _VALUE_CONVERTERS.get(type(value))
+        if convert is not None:
+            return convert(value)
         elif isinstance(value, (list, tuple)):
             return value
         elif isinstance(value, (str, int, float, bool, date, datetime)):
@@ -101,42 +99,81 @@ class PolarsFilterBuilder:
         # Process value for Polars compatibility
         processed_value = self._process_value_for_operator(operator, value)
 
-        mapping = {
-            FilterOperator.EQ: col_ref.eq(processed_value),
-            FilterOperator.NE: col_ref.ne(processed_value),
-            FilterOperator.GT: col_ref.gt(processed_value),
-            FilterOperator.LT: col_ref.lt(processed_value),
-            FilterOperator.GE: col_ref.ge(processed_value),
-            FilterOperator.LE: col_ref.le(processed_value),
-            FilterOperator.CONTAINS: col_ref.str.contains(str(processed_value)),
-            FilterOperator.NOT_CONTAINS: ~col_ref.str.contains(str(processed_value)),
-            FilterOperator.STARTS_WITH: col_ref.str.starts_with(str(processed_value)),
-            FilterOperator.ENDS_WITH: col_ref.str.ends_with(str(processed_value)),
-            FilterOperator.IN: col_ref.is_in(processed_value),
-            FilterOperator.NOT_IN: ~col_ref.is_in(processed_value),
-            FilterOperator.IS_NULL: col_ref.is_null(),
-            FilterOperator.IS_NOT_NULL: col_ref.is_not_null(),
-            FilterOperator.HAS_KEY: col_ref.struct.field(str(processed_value)).is_not_null(),  # Approximation
-        }
-
-        if operator in mapping:
-            return mapping[operator]
-
-        raise ValueError(f"Unsupported operator for Polars: {operator}")
+        build_expression = _POLARS_OPERATORS.get(operator)
+        if build_expression is None:
+            raise ValueError(f"Unsupported operator for Polars: {operator}")
+
+        return build_expression(col_ref, processed_value)
 
     def _process_value_for_operator(self, operator: FilterOperator, value: Any) -> Any:
         """Process value based on the operator requirements"""
         if value is None:
             return None
 
-        if operator in [FilterOperator.IN, FilterOperator.NOT_IN]:
+        if operator in _MEMBERSHIP_OPERATORS:
             return self._process_value_for_polars(value)
-        elif operator in [
-            FilterOperator.CONTAINS,
-            FilterOperator.NOT_CONTAINS,
-            FilterOperator.STARTS_WITH,
-            FilterOperator.ENDS_WITH,
-        ]:
+        elif operator in _STRING_OPERATORS:
             return str(value)
         else:
             return value
+
+
+_ANY_LIST_OPERATORS = frozenset({FilterOperator.ANY_IN, FilterOperator.LIST_OVERLAP})
+_MEMBERSHIP_OPERATORS = frozenset({FilterOperator.IN, FilterOperator.NOT_IN})
+_STRING_OPERATORS = frozenset({FilterOperator.CONTAINS, FilterOperator.NOT_CONTAINS, FilterOperator.STARTS_WITH, FilterOperator.ENDS_WITH})
+
+
+def _as_list(value: Any) -> Any:
+    return [value]
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+# Exact-type fast path for _process_value_for_polars; subclasses and other types take the isinstance chain
+_VALUE_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    type(None): _as_is,
+    list: _as_is,
+    tuple: _as_is,
+    str: _as_list,
+    int: _as_list,
+    float: _as_list,
+    bool: _as_list,
+    date: _as_list,
+    datetime: _as_list,
+}
+
+
+@lru_cache(maxsize=4096)
+def _json_col_reference(column: str, json_path: Optional[str]) -> pl.Expr:
+    # Expressions are immutable, so the chained struct.field() reference is built once per (column, json_path)
+    col_ref = pl.col(column)
+    if not json_path:
+        return col_ref
+
+    # This assumes your JSON columns are properly structured as structs
+    for part in json_path.split("."):
+        col_ref = col_ref.struct.field(part)
+
+    return col_ref
+
+
+# Built lazily per call, so only the chosen operator's expression is constructed
+_POLARS_OPERATORS: Dict[FilterOperator, Callable[[pl.Expr, Any], pl.Expr]] = {
+    FilterOperator.EQ: lambda col_ref, value: col_ref.eq(value),
+    FilterOperator.NE: lambda col_ref, value: col_ref.ne(value),
+    FilterOperator.GT: lambda col_ref, value: col_ref.gt(value),
+    FilterOperator.LT: lambda col_ref, value: col_ref.lt(value),
+    FilterOperator.GE: lambda col_ref, value: col_ref.ge(value),
+    FilterOperator.LE: lambda col_ref, value: col_ref.le(value),
+    FilterOperator.CONTAINS: lambda col_ref, value: col_ref.str.contains(str(value)),
+    FilterOperator.NOT_CONTAINS: lambda col_ref, value: ~col_ref.str.contains(str(value)),
+    FilterOperator.STARTS_WITH: lambda col_ref, value: col_ref.str.starts_with(str(value)),
+    FilterOperator.ENDS_WITH: lambda col_ref, value: col_ref.str.ends_with(str(value)),
+    FilterOperator.IN: lambda col_ref, value: col_ref.is_in(value),
+    FilterOperator.NOT_IN: lambda col_ref, value: ~col_ref.is_in(value),
+    FilterOperator.IS_NULL: lambda col_ref, value: col_ref.is_null(),
+    FilterOperator.IS_NOT_NULL: lambda col_ref, value: col_ref.is_not_null(),
+    FilterOperator.HAS_KEY: lambda col_ref, value: col_ref.struct.field(str(value)).is_not_null(),  # Approximation
+}
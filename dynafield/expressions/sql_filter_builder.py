@@ -1,8 +1,14 @@
 # sql_filter_builder.py
-from typing import Any, List, Tuple
+import re
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from dynafield.expressions.types import ColumnFilter, FilterExpression, FilterOperator, LogicalFilter, LogicalOperator
 
+# (sql, params, operator joining the sql at its top level, or None for a single predicate)
+_BuiltCondition = Tuple[str, List[Any], Optional[LogicalOperator]]
+
 
 class SQLFilterBuilder:
     """Converts filter expressions to SQL with enhanced JSONB and list support"""
@@ -27,13 +33,7 @@ class SQLFilterBuilder:
         column_ref = self._build_column_reference(filter)
 
         # Handle special list operations
-        if filter.operator in [
-            FilterOperator.ANY_IN,
-            FilterOperator.ALL_IN,
-            FilterOperator.NONE_IN,
-            FilterOperator.LIST_OVERLAP,
-            FilterOperator.LIST_CONTAINS,
-        ]:
+        if filter.operator in _SQL_LIST_OPERATORS:
             sql, param_value = self._build_list_operation(filter, column_ref)
         else:
             sql, param_value = self._get_sql_operator(filter.operator, filter.value, column_ref)
@@ -48,76 +48,138 @@ class SQLFilterBuilder:
 
     def build_logical_filter(self, filter: LogicalFilter) -> Tuple[str, List[Any]]:
         """Build SQL for logical AND/OR filters"""
-        all_params: List[Any] = []
-        condition_sqls: List[str] = []
+        # Walk the tree with an explicit stack instead of recursing once per nesting level;
+        # results holds the built (sql, params, top-level operator) of finished nodes in condition order
+        results: List[_BuiltCondition] = []
+        stack: List[Tuple[FilterExpression, bool]] = [(filter, False)]
+
+        while stack:
+            node, children_built = stack.pop()
+            if isinstance(node, ColumnFilter):
+                sql, params = self.build_column_filter(node)
+                results.append((sql, params, None))
+            elif isinstance(node, LogicalFilter):
+                if children_built:
+                    split = len(results) - len(node.conditions)
+                    built = results[split:]
+                    del results[split:]
+                    results.append(self._join_conditions(node.operator, built))
+                else:
+                    stack.append((node, True))
+                    stack.extend((condition, False) for condition in reversed(node.conditions))
+            else:
+                raise ValueError(f"Unsupported expression type: {type(node)}")
+
+        sql, params, _ = results[0]
+        return sql, params
 
-        for condition in filter.conditions:
-            sql, params = self.build(condition)  # Recursively build each condition
-            condition_sqls.append(f"({sql})")
-            all_params.extend(params)
+    @staticmethod
+    def _join_conditions(operator: LogicalOperator, built: List[_BuiltCondition]) -> _BuiltCondition:
+        if len(built) == 1:
+            # A single condition is its own result; keep its operator so the parent still wraps it if needed
+            return built[0]
 
-        operator = " AND " if filter.operator == LogicalOperator.AND else " OR "
-        sql = operator.join(condition_sqls)
+        # Column predicates bind tighter than AND/OR, and a same-operator group flattens into its parent,
+        # so only a group under a different operator needs parentheses
+        joiner = " AND " if operator == LogicalOperator.AND else " OR "
+        sql = joiner.join([condition_sql if condition_operator in (None, operator) else f"({condition_sql})" for condition_sql, _, condition_operator in built])
+        all_params = list(chain.from_iterable(params for _, params, _ in built))
 
-        return sql, all_params
+        return sql, all_params, operator
 
     def _build_column_reference(self, filter: ColumnFilter) -> str:
         """Build the appropriate column reference for SQL"""
-        if not filter.json_path:
-            return filter.column
-
-        # Handle nested JSON paths like 'user.address.city'
-        path_parts = filter.json_path.split(".")
-
-        if len(path_parts) == 1:
-            # Simple path: column->>'field'
-            return f"{filter.column} ->> '{path_parts[0]}'"
-        else:
-            # Nested path: use #> operator for path navigation
-            json_path = ",".join(path_parts)
-            return f"{filter.column} #> '{{{json_path}}}'"
+        return _column_reference(filter.column, filter.json_path)
 
     def _build_list_operation(self, filter: ColumnFilter, column_ref: str) -> Tuple[str, Any]:
         """Build SQL for list-to-list operations"""
         if not isinstance(filter.value, list):
             raise ValueError(f"List operations require list value, got {type(filter.value)}")
 
-        mapping = {
-            FilterOperator.ANY_IN: (f"{column_ref} && %s::text[]", filter.value),
-            FilterOperator.ALL_IN: (f"{column_ref} @> %s::text[]", filter.value),
-            FilterOperator.NONE_IN: (f"NOT ({column_ref} && %s::text[])", filter.value),
-            FilterOperator.LIST_OVERLAP: (f"{column_ref} && %s::text[]", filter.value),
-            FilterOperator.LIST_CONTAINS: (f"{column_ref} @> %s::text[]", filter.value),
-        }
-
-        if filter.operator not in mapping:
+        template = _SQL_LIST_OPERATORS.get(filter.operator)
+        if template is None:
             raise ValueError(f"Unsupported list operator: {filter.operator}")
 
-        return mapping[filter.operator]
+        return template.format(column=column_ref), filter.value
 
     def _get_sql_operator(self, operator: FilterOperator, value: Any, column_ref: str) -> Tuple[str, Any]:
         """Map FilterOperator to SQL operator with enhanced JSON support"""
-        mapping = {
-            FilterOperator.EQ: (f"{column_ref} = %s", value),
-            FilterOperator.NE: (f"{column_ref} != %s", value),
-            FilterOperator.GT: (f"{column_ref} > %s", value),
-            FilterOperator.LT: (f"{column_ref} < %s", value),
-            FilterOperator.GE: (f"{column_ref} >= %s", value),
-            FilterOperator.LE: (f"{column_ref} <= %s", value),
-            FilterOperator.CONTAINS: (f"{column_ref} LIKE %s", f"%{value}%" if value else None),
-            FilterOperator.NOT_CONTAINS: (f"{column_ref} NOT LIKE %s", f"%{value}%" if value else None),
-            FilterOperator.STARTS_WITH: (f"{column_ref} LIKE %s", f"{value}%" if value else None),
-            FilterOperator.ENDS_WITH: (f"{column_ref} LIKE %s", f"%{value}" if value else None),
-            FilterOperator.ILIKE: (f"{column_ref} ILIKE %s", value),
-            FilterOperator.NOT_ILIKE: (f"{column_ref} NOT ILIKE %s", value),
-            FilterOperator.IN: (f"{column_ref} IN %s", tuple(value) if value else None),
-            FilterOperator.NOT_IN: (f"{column_ref} NOT IN %s", tuple(value) if value else None),
-            FilterOperator.IS_NULL: (f"{column_ref} IS NULL", None),
-            FilterOperator.IS_NOT_NULL: (f"{column_ref} IS NOT NULL", None),
-            FilterOperator.HAS_KEY: (f"{column_ref} ? %s", value),
-        }
-
-        if operator in mapping:
-            return mapping[operator]
-
-        raise ValueError(f"Unsupported operator for SQL: {operator}")
+        entry = _SQL_OPERATORS.get(operator)
+        if entry is None:
+            raise ValueError(f"Unsupported operator for SQL: {operator}")
+
+        template, to_param = entry
+        return template.format(column=column_ref), to_param(value)
+
+
+# Plain or double-quoted identifiers, optionally qualified (table.column)
+_IDENTIFIER_PART = r'(?:[A-Za-z_][A-Za-z0-9_$]*|"(?:[^"]|"")+")'
+_COLUMN_RE = re.compile(rf"{_IDENTIFIER_PART}(?:\.{_IDENTIFIER_PART})*")
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _quote_array_element(value: str) -> str:
+    # Element of a text[] literal such as '{a,"b c"}'
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@lru_cache(maxsize=4096)
+def _column_reference(column: str, json_path: Optional[str]) -> str:
+    # The same (column, json_path) pairs recur across requests, so each fragment is built (and checked) once
+    if not _COLUMN_RE.fullmatch(column):
+        raise ValueError(f"Invalid column name: {column!r}")
+    if not json_path:
+        return column
+
+    # Handle nested JSON paths like 'user.address.city'; keys are quoted since they are inlined into the SQL
+    path_parts = json_path.split(".")
+
+    if len(path_parts) == 1:
+        # Simple path: column->>'field'
+        return f"{column} ->> {_quote_literal(path_parts[0])}"
+    else:
+        # Nested path: use #> operator for path navigation
+        joined_path = ",".join(_quote_array_element(part) for part in path_parts)
+        return f"{column} #> {_quote_literal('{' + joined_path + '}')}"
+
+
+# Per-operator SQL template and parameter transform, so only the chosen operator's value is prepared
+_SQL_LIST_OPERATORS: Dict[FilterOperator, str] = {
+    FilterOperator.ANY_IN: "{column} && %s::text[]",
+    FilterOperator.ALL_IN: "{column} @> %s::text[]",
+    FilterOperator.NONE_IN: "NOT ({column} && %s::text[])",
+    FilterOperator.LIST_OVERLAP: "{column} && %s::text[]",
+    FilterOperator.LIST_CONTAINS: "{column} @> %s::text[]",
+}
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+def _no_param(value: Any) -> Any:
+    return None
+
+
+_SQL_OPERATORS: Dict[FilterOperator, Tuple[str, Callable[[Any], Any]]] = {
+    FilterOperator.EQ: ("{column} = %s", _as_is),
+    FilterOperator.NE: ("{column} != %s", _as_is),
+    FilterOperator.GT: ("{column} > %s", _as_is),
+    FilterOperator.LT: ("{column} < %s", _as_is),
+    FilterOperator.GE: ("{column} >= %s", _as_is),
+    FilterOperator.LE: ("{column} <= %s", _as_is),
+    FilterOperator.CONTAINS: ("{column} LIKE %s", lambda value: f"%{value}%" if value else None),
+    FilterOperator.NOT_CONTAINS: ("{column} NOT LIKE %s", lambda value: f"%{value}%" if value else None),
+    FilterOperator.STARTS_WITH: ("{column} LIKE %s", lambda value: f"{value}%" if value else None),
+    FilterOperator.ENDS_WITH: ("{column} LIKE %s", lambda value: f"%{value}" if value else None),
+    FilterOperator.ILIKE: ("{column} ILIKE %s", _as_is),
+    FilterOperator.NOT_ILIKE: ("{column} NOT ILIKE %s", _as_is),
+    FilterOperator.IN: ("{column} IN %s", lambda value: tuple(value) if value else None),
+    FilterOperator.NOT_IN: ("{column} NOT IN %s", lambda value: tuple(value) if value else None),
+    FilterOperator.IS_NULL: ("{column} IS NULL", _no_param),
+    FilterOperator.IS_NOT_NULL: ("{column} IS NOT NULL", _no_param),
+    FilterOperator.HAS_KEY: ("{column} ? %s", _as_is),
+}
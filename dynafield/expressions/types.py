@@ -1,10 +1,68 @@
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import polars as pl
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from dynafield.expressions.polars_filter_builder import PolarsFilterBuilder
+    from dynafield.expressions.sql_filter_builder import SQLFilterBuilder
+
+# The builders are stateless; one instance of each is shared by every to_sql()/to_polars() call.
+# They import this module, so they are created on first use rather than imported at the top.
+_sql_builder: Optional["SQLFilterBuilder"] = None
+_polars_builder: Optional["PolarsFilterBuilder"] = None
+
+
+def _get_sql_builder() -> "SQLFilterBuilder":
+    global _sql_builder
+    if _sql_builder is None:
+        from dynafield.expressions.sql_filter_builder import SQLFilterBuilder
+
+        _sql_builder = SQLFilterBuilder()
+    return _sql_builder
+
+
+def _get_polars_builder() -> "PolarsFilterBuilder":
+    global _polars_builder
+    if _polars_builder is None:
+        from dynafield.expressions.polars_filter_builder import PolarsFilterBuilder
+
+        _polars_builder = PolarsFilterBuilder()
+    return _polars_builder
+
+
+POLARS_EXPR_CACHE_SIZE = 1024
+
+# structural_key() -> built pl.Expr; expressions are immutable, so one can serve every equal filter tree
+_polars_expr_cache: Dict[Hashable, pl.Expr] = {}
+
+
+def _to_polars_cached(expression: "FilterExpression") -> pl.Expr:
+    try:
+        key = expression.structural_key()
+        expr = _polars_expr_cache.get(key)
+    except TypeError:
+        # a value that can't be hashed (e.g. a set inside a list): build uncached
+        return _get_polars_builder().build(expression)
+
+    if expr is None:
+        expr = _get_polars_builder().build(expression)
+        if len(_polars_expr_cache) >= POLARS_EXPR_CACHE_SIZE:
+            del _polars_expr_cache[next(iter(_polars_expr_cache))]
+        _polars_expr_cache[key] = expr
+    return expr
+
+
+def _freeze_value(value: Any) -> Hashable:
+    # Tagged with the type, so e.g. 1, 1.0, True and "1" or a date and its ISO string stay distinct
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze_value(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze_value(item)) for key, item in value.items()))
+    return (type(value), value)
+
 
 class FilterOperator(Enum):
     EQ = "EQ"
@@ -46,6 +104,10 @@ class BaseFilterExpression(BaseModel):
     def to_polars(self) -> pl.Expr:
         raise NotImplementedError("Subclasses must implement to_polars()")
 
+    def structural_key(self) -> Hashable:
+        """Hashable key that is equal for structurally equal filters"""
+        raise NotImplementedError("Subclasses must implement structural_key()")
+
     class Config:
         use_enum_values = False
 
@@ -60,19 +122,14 @@ class ColumnFilter(BaseFilterExpression):
 
     def to_sql(self) -> Tuple[str, List[Any]]:
         """Convert to SQL expression"""
-        from dynafield.expressions.sql_filter_builder import SQLFilterBuilder
-
-        builder = SQLFilterBuilder()
-        result = builder.build_column_filter(self)
-        return result
+        return _get_sql_builder().build_column_filter(self)
 
     def to_polars(self) -> pl.Expr:
         """Convert to Polars expression"""
-        from dynafield.expressions.polars_filter_builder import PolarsFilterBuilder
+        return _to_polars_cached(self)
 
-        builder = PolarsFilterBuilder()
-        result = builder.build_column_filter(self)
-        return result
+    def structural_key(self) -> Hashable:
+        return (self.column, self.operator, self.json_path, _freeze_value(self.value))
 
 
 class LogicalFilter(BaseFilterExpression):
@@ -82,18 +139,13 @@ class LogicalFilter(BaseFilterExpression):
     conditions: List["FilterExpression"]
 
     def to_sql(self) -> Tuple[str, List[Any]]:
-        from dynafield.expressions.sql_filter_builder import SQLFilterBuilder
-
-        builder = SQLFilterBuilder()
-        result = builder.build_logical_filter(self)
-        return result
+        return _get_sql_builder().build_logical_filter(self)
 
     def to_polars(self) -> pl.Expr:
-        from dynafield.expressions.polars_filter_builder import PolarsFilterBuilder
+        return _to_polars_cached(self)
 
-        builder = PolarsFilterBuilder()
-        result = builder.build_logical_filter(self)
-        return result
+    def structural_key(self) -> Hashable:
+        return (self.operator, tuple(condition.structural_key() for condition in self.conditions))
 
 
 FilterExpression = Union[ColumnFilter, LogicalFilter]
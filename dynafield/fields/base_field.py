@@ -1,11 +1,15 @@
 import uuid
+from copy import deepcopy
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Callable, Sequence
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Mapping, Sequence
 
+from pydantic import BaseModel as PydanticBaseModel
 from pydantic import EmailStr, Field, create_model
 
 from dynafield.base_model import BaseModel
+from dynafield.utils import json_tools
 from dynafield.utils.uuid import uuid_7
 
 
@@ -24,26 +28,30 @@ class FieldTypeEnum(str, Enum):
     ObjectField = "ObjectFieldGql"
 
     def to_py_type(self) -> Any:
-        type_mapping = {
-            FieldTypeEnum.UuidField: uuid.UUID,
-            FieldTypeEnum.StrField: str,
-            FieldTypeEnum.EmailField: EmailStr,
-            FieldTypeEnum.IntField: int,
-            FieldTypeEnum.FloatField: float,
-            FieldTypeEnum.BoolField: bool,
-            FieldTypeEnum.DateField: date,
-            FieldTypeEnum.DateTimeField: datetime,
-            FieldTypeEnum.JsonField: dict[str, Any],
-            FieldTypeEnum.ListField: list[Any],
-        }
-        return type_mapping[self]
+        return _FIELD_PY_TYPES[self]
+
+
+_FIELD_PY_TYPES: Mapping[FieldTypeEnum, Any] = MappingProxyType(
+    {
+        FieldTypeEnum.UuidField: uuid.UUID,
+        FieldTypeEnum.StrField: str,
+        FieldTypeEnum.EmailField: EmailStr,
+        FieldTypeEnum.IntField: int,
+        FieldTypeEnum.FloatField: float,
+        FieldTypeEnum.BoolField: bool,
+        FieldTypeEnum.DateField: date,
+        FieldTypeEnum.DateTimeField: datetime,
+        FieldTypeEnum.JsonField: dict[str, Any],
+        FieldTypeEnum.ListField: list[Any],
+    }
+)
 
 
 _MISSING = object()
 
 
 class DataTypeFieldBase(BaseModel):
-    id: uuid.UUID = Field(default_factory=lambda: uuid_7())
+    id: uuid.UUID = Field(default_factory=uuid_7)
     label: str
     description: str | None = None
     required: bool = False
@@ -75,13 +83,76 @@ class DataTypeFieldBase(BaseModel):
 
         return Field(default=default, **field_kwargs)
 
+    @staticmethod
+    def _copy_factory(value: Any) -> Callable[[], Any]:
+        """Default factory returning a fresh copy of a mutable default on each call."""
+        # Snapshot JSON-shaped defaults as JSON bytes: decoding is far cheaper than deepcopy. Anything the
+        # round trip would change (tuples, non-str keys, dates, NaN, ...) fails the equality check and is deep-copied.
+        try:
+            frozen = json_tools.dumps(value)
+            round_trips = json_tools.loads(frozen) == value
+        except (TypeError, ValueError):
+            round_trips = False
 
-def build_dynamic_model(name: str, fields: Sequence[DataTypeFieldBase]) -> Any:
-    field_defs: dict[str, Any] = {}
+        if round_trips:
+            return lambda: json_tools.loads(frozen)
+
+        snapshot = deepcopy(value)
+        return lambda: deepcopy(snapshot)
+
+    def to_pydantic_field(self) -> tuple[str, tuple[Any, Any]]:
+        """Return ``(label, (type, FieldInfo))``; implemented by each concrete field type."""
+        raise NotImplementedError(f"{type(self).__name__} does not define a pydantic field")
+
+
+MODEL_CACHE_SIZE = 1024
 
-    for field in fields:
-        if hasattr(field, "to_pydantic_field"):
-            key, (typ, field_def) = field.to_pydantic_field()
-            field_defs[key] = (typ, field_def)
+# (name, schema signature) -> model built by create_model, oldest evicted first once full
+_MODEL_CACHE: dict[Hashable, Any] = {}
+
+
+def _id_exclude(field: DataTypeFieldBase) -> dict[Any, Any]:
+    # Ids never reach the generated model, so schemas that differ only by field ids share a model
+    exclude: dict[Any, Any] = {"id": True}
+    nested = getattr(field, "fields", None)  # ObjectField
+    if isinstance(nested, list):
+        exclude["fields"] = {i: _id_exclude(sub_field) for i, sub_field in enumerate(nested)}
+    return exclude
+
+
+def _schema_signature(fields: Sequence[DataTypeFieldBase]) -> Hashable:
+    return tuple((type(field), field.model_dump_json(exclude=_id_exclude(field), serialize_as_any=True)) for field in fields)
+
+
+def build_dynamic_model(name: str, fields: Sequence[DataTypeFieldBase]) -> Any:
+    """Build (or reuse) a pydantic model with one attribute per field definition."""
+    try:
+        cache_key: Hashable = (name, _schema_signature(fields))
+    except Exception:
+        # e.g. a default that can't be serialized: build without caching
+        return _create_dynamic_model(name, fields)
+
+    model = _MODEL_CACHE.get(cache_key)
+    if model is None:
+        model = _create_dynamic_model(name, fields)
+        if len(_MODEL_CACHE) >= MODEL_CACHE_SIZE:
+            del _MODEL_CACHE[next(iter(_MODEL_CACHE))]
+        _MODEL_CACHE[cache_key] = model
+    return model
+
+
+def construct_instance[M: PydanticBaseModel](model: type[M], data: dict[str, Any]) -> M:
+    """Instantiate a dynamic model from trusted, already-validated data without running validation.
+
+    Nothing is coerced: nested objects stay dicts and enum values stay raw, and unset fields get
+    their defaults. Use the model constructor for anything that did not come from a validated model.
+    """
+    return model.model_construct(**data)
+
+
+def _create_dynamic_model(name: str, fields: Sequence[DataTypeFieldBase]) -> Any:
+    # Plain DataTypeFieldBase entries (e.g. untyped ObjectField children) have no pydantic field and are skipped
+    base_to_pydantic_field = DataTypeFieldBase.to_pydantic_field
+    field_defs: dict[str, Any] = dict(field.to_pydantic_field() for field in fields if type(field).to_pydantic_field is not base_to_pydantic_field)
 
     return create_model(name, **field_defs)
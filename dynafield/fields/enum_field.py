@@ -1,4 +1,5 @@
 from enum import Enum as PyEnum
+from functools import lru_cache
 from typing import Any, Literal
 
 import strawberry
@@ -20,10 +21,7 @@ class EnumField(DataTypeFieldBase):
         enum_name: str = f"{self.label.capitalize()}Enum"
 
         # Build the enum from allowed values
-        enum_class = PyEnum(
-            enum_name,
-            {val.upper(): val for val in self.allowed_values},  # type: ignore[arg-type]
-        )
+        enum_class = _build_enum(enum_name, tuple(self.allowed_values))
 
         # Turn default_str into an actual enum member (or leave as None)
         if self.default_str is not None:
@@ -44,6 +42,15 @@ class EnumField(DataTypeFieldBase):
         return obj
 
 
+@lru_cache(maxsize=1024)
+def _build_enum(enum_name: str, allowed_values: tuple[str, ...]) -> type[PyEnum]:
+    # Shared per (name, values), so equal EnumFields produce the same enum class instead of a new one each time
+    return PyEnum(  # type: ignore[return-value]
+        enum_name,
+        {val.upper(): val for val in allowed_values},  # type: ignore[arg-type]
+    )
+
+
 @pyd_type(model=EnumField)
 class EnumFieldGql:
     id: strawberry.auto
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Any, Literal
 
 import strawberry
@@ -15,11 +14,7 @@ class JsonField(DataTypeFieldBase):
 
     def to_pydantic_field(self) -> tuple[str, tuple[type[dict[str, Any]], Any]]:
         if self.default_dict is not None:
-
-            def default_factory(value: dict[str, Any] | None = self.default_dict) -> dict[str, Any] | None:
-                return deepcopy(value) if value is not None else None
-
-            return self.label, (dict[str, Any], self._build_field(default_factory=default_factory))
+            return self.label, (dict[str, Any], self._build_field(default_factory=self._copy_factory(self.default_dict)))
 
         return self.label, (dict[str, Any], self._build_field(default=None))
 
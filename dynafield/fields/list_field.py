@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Any, Literal
 
 import strawberry
@@ -15,11 +14,7 @@ class ListField(DataTypeFieldBase):
 
     def to_pydantic_field(self) -> tuple[str, tuple[type[list[Any]], Any]]:
         if self.default_list is not None:
-
-            def default_factory(value: list[Any] | None = self.default_list) -> dict[str, Any]:
-                return deepcopy(value)
-
-            return self.label, (list[Any], self._build_field(default_factory=default_factory))
+            return self.label, (list[Any], self._build_field(default_factory=self._copy_factory(self.default_list)))
 
         return self.label, (list[Any], self._build_field(default=None))
 
@@ -66,6 +66,9 @@ TypeFieldsUnion = Annotated[
     Field(discriminator="typename__"),
 ]
 
+# typename__ -> field class, resolved once at import for code that dispatches on the discriminator by hand
+TYPE_FIELDS_BY_TYPENAME: dict[str, type[BaseModel]] = {cls.model_fields["typename__"].default: cls for cls in t.get_args(t.get_args(TypeFieldsUnion)[0])}
+
 
 def _get_default(info: FieldInfo):
     """Return a usable default value (None if undefined)."""
@@ -165,7 +168,7 @@ def pydantic_field_to_dyn_field(name: str, info: FieldInfo) -> TypeFieldsUnion:
 
 
 class RecordSchemaDefinition(BaseModel):
-    id: UUID = Field(default_factory=lambda: uuid_7())
+    id: UUID = Field(default_factory=uuid_7)
     ref: str | None = None  # Unique record name
     name: str = "record name"
     description: str | None = None
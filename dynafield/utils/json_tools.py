@@ -0,0 +1,32 @@
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, allow_nan: bool = True) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Non-ASCII text is emitted as UTF-8 in both paths. orjson stringifies non-string dict keys
+    (UUIDs, enums, datetimes, ...); stdlib json only accepts str/int/float/bool/None keys and raises otherwise.
+    ``default`` is called for values the encoder cannot serialize itself, as with ``json.dumps``.
+    ``allow_nan=False`` makes the stdlib path raise on NaN/Infinity instead of emitting invalid JSON;
+    orjson always writes them as ``null``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=default, ensure_ascii=False, allow_nan=allow_nan).encode("utf-8")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON from ``bytes``/``str`` without an intermediate decode step."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
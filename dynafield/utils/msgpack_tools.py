@@ -0,0 +1,28 @@
+from typing import Any, cast
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the installed extras
+    # cast keeps mypy happy whether or not msgpack (and its stubs) are installed
+    msgpack = cast(Any, None)
+
+HAS_MSGPACK = msgpack is not None
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed, install dynafield[msgpack] to use the msgpack serializer")
+
+
+def packb(obj: Any) -> bytes:
+    """Serialize ``obj`` to MessagePack bytes (str and bytes stay distinct types on the wire)."""
+    _require_msgpack()
+    return msgpack.packb(obj, use_bin_type=True)  # type: ignore[no-any-return]
+
+
+def unpackb(data: bytes | bytearray | memoryview) -> Any:
+    """Deserialize MessagePack bytes produced by ``packb``."""
+    _require_msgpack()
+    return msgpack.unpackb(data, raw=False)
@@ -1,8 +1,9 @@
 import uuid
 
-from uuid_utils import uuid7
+from uuid_utils.compat import uuid7
 
 
 def uuid_7() -> uuid.UUID:
     # Note: Not part of standard python will be added at python 3.14. Using this for now as primary key
-    return uuid.UUID(str(uuid7()))
+    # compat.uuid7 builds the stdlib UUID directly, without a round trip through its string form
+    return uuid7()
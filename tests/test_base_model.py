@@ -157,6 +157,19 @@ def test_merged_with_all_rules():
     assert merged.name == "Ada Lovelace"
 
 
+def test_merged_with_leaves_self_unchanged():
+    u1 = User(id=uuid.uuid4(), name="A", tags=["x"], settings={"a": 1}, address=Address(street="S", city="C", meta={"k": 1}))
+    u2 = User(id=u1.id, name="B", tags=["y"], settings={"b": 2}, address=Address(city="C2", meta={"j": 2}))
+    before = u1.model_dump()
+
+    merged = u1.merged_with(u2, exclude_unset=True, exclude_none=True)
+
+    assert u1.model_dump() == before
+    assert merged.tags is not u1.tags
+    assert merged.settings is not u1.settings
+    assert merged.address is not u1.address
+
+
 def test_merged_with_type_mismatch():
     a = Address(street="x")
     b = User(id=uuid.uuid4(), name="n", created_at=dt.datetime.now())
@@ -174,6 +187,25 @@ def test_update_from_mutates_in_place():
     assert u1 == merged
 
 
+def test_update_from_skips_unchanged_fields():
+    address = Address(street="S", city="C")
+    u1 = User(name="A", tags=["x"], address=address)
+    u2 = User(name="A", tags=["x"], age=3)
+    u1.update_from(u2, exclude_unset=True, exclude_none=True)
+    assert u1.address is address
+    assert u1.tags == ["x"]
+    assert u1.age == 3
+
+
+def test_update_from_marks_updated_fields_set():
+    u1 = User(name="A")
+    u2 = User(name="B", age=3)
+    u1.update_from(u2, exclude_unset=True, exclude_none=True)
+    assert u1.name == "B"
+    assert {"name", "age"} <= u1.model_fields_set
+    assert u1.dump() == {"name": "B", "age": 3}
+
+
 def test_merge_respects_exclude_unset():
     u1 = User(id=uuid.uuid4(), name="A", created_at=dt.datetime(2020, 1, 1), age=20)
     # u2 doesn't set age; exclude_unset=True should keep existing
@@ -259,6 +291,15 @@ def test_serialize_values_enum_as_name():
     assert "GREEN" in out
 
 
+def test_serialize_values_deep_nesting_leaves_input_untouched():
+    uid = uuid.UUID(int=7)
+    data = {"rows": [[{"id": uid, "color": Color.RED, "n": 1, "none": None}]], "top": uid}
+    out = serialize_values(data)
+    assert out == {"rows": [[{"id": str(uid), "color": 1, "n": 1, "none": None}]], "top": str(uid)}
+    assert data["rows"][0][0]["id"] is uid
+    assert serialize_values(uid) == str(uid)
+
+
 # ---------------------------
 # Custom JSON serializer/deserializer & response
 # ---------------------------
@@ -354,6 +395,13 @@ def test_merge_value_list_dedup_and_order():
     assert merged.tags == ["a", "b", "c", "d"]
 
 
+def test_merge_value_list_dedup_unhashable_items():
+    u = User()
+    merged = u._merge_value("rows", [{"a": 1}], [{"a": 1}, {"b": 2}, {"b": 2}])
+    assert merged == [{"a": 1}, {"b": 2}]
+    assert u._merge_value("tags", ["a"], ["b", "b", "a"]) == ["a", "b"]
+
+
 def test_merge_value_dict_union():
     u = User(id=uuid.uuid4(), name="A", created_at=dt.datetime.now(), settings={"x": 1, "y": 2})
     incoming = User(id=u.id, name="A", created_at=u.created_at, settings={"y": 20, "z": 3})
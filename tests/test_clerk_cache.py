@@ -0,0 +1,84 @@
+import asyncio
+import importlib
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+from redis._parsers.encoders import Encoder
+
+from dynafield import config
+
+
+class FakeRedis:
+    """In-memory stand-in that encodes/decodes like rediskit's client (decode_responses=True)."""
+
+    def __init__(self) -> None:
+        self.encoder = Encoder(encoding="utf-8", encoding_errors="strict", decode_responses=True)
+        self.store: Dict[bytes, bytes] = {}
+
+    def _key(self, key: Union[str, bytes]) -> bytes:
+        return self.encoder.encode(key)
+
+    async def get(self, key: Union[str, bytes]) -> Optional[str]:
+        value = self.store.get(self._key(key))
+        return None if value is None else self.encoder.decode(value)
+
+    async def setex(self, key: Union[str, bytes], ttl: int, value: Any) -> None:
+        self.store[self._key(key)] = self.encoder.encode(value)
+
+    async def delete(self, *keys: Union[str, bytes]) -> None:
+        for key in keys:
+            self.store.pop(self._key(key), None)
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis) -> None:
+        self.client = client
+        self.commands: List[Any] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def get(self, key: Union[str, bytes]) -> None:
+        self.commands.append(self.client.get(key))
+
+    def setex(self, key: Union[str, bytes], ttl: int, value: Any) -> None:
+        self.commands.append(self.client.setex(key, ttl, value))
+
+    async def execute(self) -> List[Any]:
+        return [await command for command in self.commands]
+
+
+@pytest.fixture
+def clerk_cache_module(monkeypatch: pytest.MonkeyPatch) -> Any:
+    # the module builds a PyJWKClient at import time, which rejects an empty JWKS URL
+    monkeypatch.setattr(config, "CLERK_JWKS_URL", "https://example.invalid/.well-known/jwks.json")
+    module = importlib.import_module("dynafield.clerk.clerk_cache")
+    fake = FakeRedis()
+
+    async def get_connection() -> FakeRedis:
+        return fake
+
+    monkeypatch.setattr(module, "get_redis_connection", get_connection)
+    return module
+
+
+def test_cached_user_round_trips_through_decoding_client(clerk_cache_module: Any) -> None:
+    cache = clerk_cache_module.ClerkTokenCache()
+    user = {"user_id": "user_1", "email": "zoë@example.com", "roles": ["admin"], "metadata": {"tenant": 7}}
+
+    async def run() -> None:
+        await cache.cache_user_both("token-abc", "user_1", user)
+        assert await cache.get_cached_user("token-abc") == user
+        assert await cache.get_cached_user_by_id("user_1") == user
+        assert await cache.get_cached_user_with_user_id("token-abc", "user_1") == (user, user)
+
+        await cache.invalidate_user_cache("user_1")
+        assert await cache.get_cached_user_by_id("user_1") is None
+
+    asyncio.run(run())
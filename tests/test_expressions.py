@@ -0,0 +1,27 @@
+import polars as pl
+import pytest
+
+from dynafield.expressions.filters import exp_and_, exp_col, exp_or_
+
+
+def test_sql_rejects_unsafe_column_name() -> None:
+    with pytest.raises(ValueError, match="Invalid column name"):
+        exp_col("a; drop").eq(1).to_sql()
+
+
+def test_sql_escapes_quote_in_json_path_key() -> None:
+    assert exp_col("data").json("y'z").eq(1).to_sql() == ("data ->> 'y''z' = %s", [1])
+
+
+def test_sql_parenthesizes_nested_or_inside_and() -> None:
+    expression = exp_and_(exp_col("a").eq(1), exp_or_(exp_col("b").eq(2), exp_col("c").eq(3)))
+
+    assert expression.to_sql() == ("a = %s AND (b = %s OR c = %s)", [1, 2, 3])
+
+
+def test_polars_list_contains_requires_every_value() -> None:
+    df = pl.DataFrame({"tags": [["x", "y"], ["x"], []]})
+
+    assert df.filter(exp_col("tags").list_contains(["x", "y"]).to_polars())["tags"].to_list() == [["x", "y"]]
+    # no values to require matches every row
+    assert df.filter(exp_col("tags").list_contains([]).to_polars()).height == 3
@@ -1,6 +1,6 @@
 from dynafield.fields.int_field import IntField
 from dynafield.fields.str_field import StrField
-from dynafield.record_schema import RecordSchemaDefinition, RecordSchemaRegistry
+from dynafield.record_schema import TYPE_FIELDS_BY_TYPENAME, RecordSchemaDefinition, RecordSchemaRegistry
 
 
 def _build_sample_schema() -> RecordSchemaDefinition:
@@ -56,3 +56,9 @@ def test_mutate_records_with_registry():
     assert mutated_records[1].party_size == 3
     assert mutated_records[2].customer_name == "Charlie"
     assert mutated_records[2].party_size == 6
+
+
+def test_type_fields_by_typename_covers_union():
+    assert len(TYPE_FIELDS_BY_TYPENAME) == 12
+    assert TYPE_FIELDS_BY_TYPENAME["StrField"] is StrField
+    assert TYPE_FIELDS_BY_TYPENAME["IntField"] is IntField
@@ -5,7 +5,7 @@ from typing import Literal
 import pytest
 from pydantic import ValidationError
 
-from dynafield.fields.base_field import build_dynamic_model
+from dynafield.fields.base_field import build_dynamic_model, construct_instance
 from dynafield.fields.bool_field import BoolField
 from dynafield.fields.date_field import DateField, DateTimeField
 from dynafield.fields.email_field import EmailField
@@ -177,6 +177,31 @@ def test_nested_object_field():
     assert instance.user.contact_email == "john.doe@example.com"
 
 
+def test_build_dynamic_model_reuses_model_for_same_schema():
+    def fields(min_length: int) -> list:
+        return [
+            StrField(label="name", constraints_str=StrFieldConstraints(min_length=min_length)),
+            ObjectField(label="address", fields=[StrField(label="city", required=True)]),
+        ]
+
+    model_cls = build_dynamic_model("CachedModel", fields(2))
+
+    assert build_dynamic_model("CachedModel", fields(2)) is model_cls
+    assert build_dynamic_model("CachedModel", fields(3)) is not model_cls
+    assert build_dynamic_model("OtherCachedModel", fields(2)) is not model_cls
+
+
+def test_construct_instance_skips_validation():
+    model_cls = build_dynamic_model(
+        "TrustedModel", [IntField(label="age", constraints_int=IntFieldConstraints(ge_int=18)), StrField(label="name", default_str="x")]
+    )
+
+    obj = construct_instance(model_cls, {"age": 10})
+
+    assert obj.age == 10
+    assert obj.name == "x"
+
+
 def test_combined_model_multiple_field_types():
     now = datetime.now()
     today = date.today()
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any, List, Optional
+
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Field, SQLModel
+
+from dynafield.database.write import update_table_data, upsert_table_data
+
+
+class WriteItem(SQLModel, table=True):
+    id: int = Field(primary_key=True)
+    a: Optional[int] = None
+    b: Optional[int] = None
+
+
+class RecordingSession:
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    async def execute(self, stmt: Any, params: Any = None) -> None:
+        self.calls.append((stmt, params))
+
+
+def test_update_table_data_keeps_last_write_for_repeated_primary_key() -> None:
+    session = RecordingSession()
+    rows = [{"id": 1, "a": 1, "b": 1}, {"id": 1, "a": 2}, {"id": 1, "a": 3, "b": 3}, {"id": 2, "a": 5}]
+
+    asyncio.run(update_table_data(session, WriteItem, rows))  # type: ignore[arg-type]
+
+    assert len(session.calls) == 1
+    _, params = session.calls[0]
+    assert sorted(params, key=lambda row: row["id"]) == [{"id": 1, "a": 3, "b": 3}, {"id": 2, "a": 5}]
+
+
+def test_upsert_table_data_writes_last_row_per_primary_key() -> None:
+    session = RecordingSession()
+    items = [WriteItem(id=1, a=1), WriteItem(id=2, a=2), WriteItem(id=1, a=3, b=3)]
+
+    asyncio.run(upsert_table_data(session, WriteItem, items))  # type: ignore[arg-type]
+
+    assert len(session.calls) == 1
+    stmt, params = session.calls[0]
+    assert params == [{"id": 1, "a": 3, "b": 3}, {"id": 2, "a": 2, "b": None}]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO UPDATE SET" in sql
+    assert "a = excluded.a" in sql and "b = excluded.b" in sql